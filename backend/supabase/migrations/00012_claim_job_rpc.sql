@@ -0,0 +1,47 @@
+-- Atomic job claiming for the document worker
+-- Replaces the worker's select + conditional update + document update (3 round trips)
+-- with a single RPC call. SKIP LOCKED lets concurrent workers claim different jobs
+-- instead of racing for the same oldest row.
+
+CREATE OR REPLACE FUNCTION public.claim_job(worker_id TEXT, job_types TEXT[] DEFAULT NULL)
+RETURNS SETOF public.document_jobs AS $$
+DECLARE
+  claimed public.document_jobs;
+BEGIN
+  WITH c AS (
+    SELECT id
+    FROM public.document_jobs
+    WHERE status = 'pending'
+      AND (claim_job.job_types IS NULL OR job_type = ANY(claim_job.job_types))
+    ORDER BY priority DESC, created_at ASC
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+  )
+  UPDATE public.document_jobs j
+  SET status = 'processing',
+      locked_at = now(),
+      locked_by = claim_job.worker_id,
+      started_at = now(),
+      updated_at = now()
+  FROM c
+  WHERE j.id = c.id
+  RETURNING j.* INTO claimed;
+
+  -- No pending jobs available
+  IF claimed.id IS NULL THEN
+    RETURN;
+  END IF;
+
+  UPDATE public.documents
+  SET status = 'processing', updated_at = now()
+  WHERE id = claimed.document_id;
+
+  RETURN NEXT claimed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Only the worker (service role) may claim jobs
+REVOKE ALL ON FUNCTION public.claim_job(TEXT, TEXT[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.claim_job(TEXT, TEXT[]) TO service_role;
+
+COMMENT ON FUNCTION public.claim_job(TEXT, TEXT[]) IS 'Atomically claims the highest-priority pending job (FOR UPDATE SKIP LOCKED) and marks its document as processing';
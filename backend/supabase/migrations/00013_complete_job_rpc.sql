@@ -0,0 +1,37 @@
+-- Atomic job completion for the document worker
+-- Replaces the worker's job update + ocr_versions read + document update (3 round trips)
+-- with a single RPC call. The ocr_versions merge happens server-side, so two engines
+-- finishing on the same document can no longer overwrite each other's versions.
+
+CREATE OR REPLACE FUNCTION public.complete_job(
+  job_id UUID,
+  document_id UUID,
+  result JSONB,
+  final_status TEXT,
+  version_key TEXT,
+  page_count INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+  UPDATE public.document_jobs
+  SET status = 'completed',
+      completed_at = now(),
+      updated_at = now(),
+      result = complete_job.result
+  WHERE id = complete_job.job_id;
+
+  UPDATE public.documents
+  SET ocr_versions = COALESCE(ocr_versions, '{}'::jsonb)
+        || jsonb_build_object(complete_job.version_key, complete_job.result),
+      status = complete_job.final_status,
+      page_count = complete_job.page_count,
+      updated_at = now()
+  WHERE id = complete_job.document_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Only the worker (service role) may complete jobs
+REVOKE ALL ON FUNCTION public.complete_job(UUID, UUID, JSONB, TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.complete_job(UUID, UUID, JSONB, TEXT, TEXT, INTEGER) TO service_role;
+
+COMMENT ON FUNCTION public.complete_job(UUID, UUID, JSONB, TEXT, TEXT, INTEGER) IS 'Marks a job completed and merges its result into documents.ocr_versions under version_key';
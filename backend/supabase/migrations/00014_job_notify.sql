@@ -0,0 +1,21 @@
+-- Notify listening workers when a job becomes pending
+-- Workers LISTEN on the job_new channel and claim immediately instead of
+-- sleeping a fixed poll interval. Payload is the job_type.
+
+CREATE OR REPLACE FUNCTION public.notify_job_new()
+RETURNS TRIGGER AS $$
+BEGIN
+  PERFORM pg_notify('job_new', NEW.job_type);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Fires on enqueue and on requeue after a failed attempt
+DROP TRIGGER IF EXISTS trigger_document_jobs_notify ON public.document_jobs;
+CREATE TRIGGER trigger_document_jobs_notify
+  AFTER INSERT OR UPDATE OF status ON public.document_jobs
+  FOR EACH ROW
+  WHEN (NEW.status = 'pending')
+  EXECUTE FUNCTION public.notify_job_new();
+
+COMMENT ON FUNCTION public.notify_job_new() IS 'Sends pg_notify(''job_new'', job_type) when a document job becomes pending';
@@ -0,0 +1,46 @@
+-- Retry backoff for requeued jobs
+-- When a job fails but has attempts left, the worker requeues it with locked_at set
+-- to a future time (capped exponential backoff with full jitter). Pending jobs are
+-- only claimable once that time has passed, so failing jobs stop being retried
+-- immediately in a tight loop.
+
+CREATE OR REPLACE FUNCTION public.claim_job(worker_id TEXT, job_types TEXT[] DEFAULT NULL)
+RETURNS SETOF public.document_jobs AS $$
+DECLARE
+  claimed public.document_jobs;
+BEGIN
+  WITH c AS (
+    SELECT id
+    FROM public.document_jobs
+    WHERE status = 'pending'
+      AND (claim_job.job_types IS NULL OR job_type = ANY(claim_job.job_types))
+      -- Requeued jobs wait out their retry backoff
+      AND (locked_at IS NULL OR locked_at <= now())
+    ORDER BY priority DESC, created_at ASC
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+  )
+  UPDATE public.document_jobs j
+  SET status = 'processing',
+      locked_at = now(),
+      locked_by = claim_job.worker_id,
+      started_at = now(),
+      updated_at = now()
+  FROM c
+  WHERE j.id = c.id
+  RETURNING j.* INTO claimed;
+
+  -- No pending jobs available
+  IF claimed.id IS NULL THEN
+    RETURN;
+  END IF;
+
+  UPDATE public.documents
+  SET status = 'processing', updated_at = now()
+  WHERE id = claimed.document_id;
+
+  RETURN NEXT claimed;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON COLUMN public.document_jobs.locked_at IS 'Timestamp when job was claimed by a worker; for requeued pending jobs, the earliest time it may be claimed again';
@@ -0,0 +1,46 @@
+-- Skip redundant document status writes when claiming jobs
+-- claim_job used to rewrite documents.status = 'processing' on every claim, even when
+-- the document was already in that state. Only touch the row when the status changes.
+
+CREATE OR REPLACE FUNCTION public.claim_job(worker_id TEXT, job_types TEXT[] DEFAULT NULL)
+RETURNS SETOF public.document_jobs AS $$
+DECLARE
+  claimed public.document_jobs;
+BEGIN
+  WITH c AS (
+    SELECT id
+    FROM public.document_jobs
+    WHERE status = 'pending'
+      AND (claim_job.job_types IS NULL OR job_type = ANY(claim_job.job_types))
+      -- Requeued jobs wait out their retry backoff
+      AND (locked_at IS NULL OR locked_at <= now())
+    ORDER BY priority DESC, created_at ASC
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+  )
+  UPDATE public.document_jobs j
+  SET status = 'processing',
+      locked_at = now(),
+      locked_by = claim_job.worker_id,
+      started_at = now(),
+      updated_at = now()
+  FROM c
+  WHERE j.id = c.id
+  RETURNING j.* INTO claimed;
+
+  -- No pending jobs available
+  IF claimed.id IS NULL THEN
+    RETURN;
+  END IF;
+
+  -- Skip the write when the document is already processing (e.g. an OCR job
+  -- following extraction) or ready (re-OCR keeps the current text readable)
+  UPDATE public.documents
+  SET status = 'processing', updated_at = now()
+  WHERE id = claimed.document_id
+    AND status NOT IN ('processing', 'ready');
+
+  RETURN NEXT claimed;
+END;
+$$ LANGUAGE plpgsql;
+
@@ -0,0 +1,13 @@
+-- Don't wake workers for jobs that are still in retry backoff
+-- fail_job requeues a job as pending with locked_at in the future (00015), and
+-- claim_job skips it until then. Notifying on that requeue woke a worker whose
+-- claim found nothing, sending it back to wait a full notify timeout instead of
+-- the backoff. Only notify for jobs that are claimable now; workers cap their
+-- LISTEN wait at the earliest backoff expiry to pick requeued jobs up on time.
+
+DROP TRIGGER IF EXISTS trigger_document_jobs_notify ON public.document_jobs;
+CREATE TRIGGER trigger_document_jobs_notify
+  AFTER INSERT OR UPDATE OF status ON public.document_jobs
+  FOR EACH ROW
+  WHEN (NEW.status = 'pending' AND (NEW.locked_at IS NULL OR NEW.locked_at <= now()))
+  EXECUTE FUNCTION public.notify_job_new();
@@ -1,48 +1,140 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
-load_dotenv()
+# Production deployments inject env vars directly and can skip .env file IO
+if not os.getenv('FLASHREAD_SKIP_DOTENV'):
+    load_dotenv()
 
-# Supabase configuration
-SUPABASE_URL = os.getenv('SUPABASE_URL', '')
-SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY', '')
+PIPELINE_VERSION = '1.0.0'
 
-# R2 configuration
-R2_ACCOUNT_ID = os.getenv('R2_ACCOUNT_ID', '')
-R2_ACCESS_KEY_ID = os.getenv('R2_ACCESS_KEY_ID', '')
-R2_SECRET_ACCESS_KEY = os.getenv('R2_SECRET_ACCESS_KEY', '')
-R2_BUCKET_NAME = os.getenv('R2_BUCKET_NAME', 'flashread-documents')
 
-# Worker configuration
-WORKER_ID = os.getenv('WORKER_ID', 'worker-1')
-POLL_INTERVAL_SECONDS = int(os.getenv('POLL_INTERVAL_SECONDS', '5'))
-PIPELINE_VERSION = '1.0.0'
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Worker configuration, read from the environment once at import"""
+    # Supabase configuration
+    supabase_url: str
+    supabase_service_role_key: str
+
+    # R2 configuration
+    r2_account_id: str
+    r2_access_key_id: str
+    r2_secret_access_key: str
+    r2_bucket_name: str
+
+    # Worker configuration
+    worker_id: str
+    poll_interval_seconds: int
+
+    # Direct Postgres connection for LISTEN/NOTIFY job dispatch (optional).
+    # When unset the worker falls back to polling every poll_interval_seconds.
+    database_url: str
+    job_notify_timeout_seconds: int
+
+    # Retry backoff: a failed job waits uniform(0, min(cap, base * 2**attempts)) seconds
+    retry_backoff_base_seconds: float
+    retry_backoff_cap_seconds: float
+
+    # OCR configuration (Phase 2b)
+    ocr_dpi_initial: int
+    ocr_dpi_rerun: int
+    ocr_min_confidence: float
+    ocr_min_chars_per_page: int
+    ocr_batch_size: int
+    tesseract_lang: str
+    # Tesseract model directory for the in-process tesserocr API (e.g.
+    # /usr/share/tesseract-ocr/5/tessdata/); empty uses the library default
+    tessdata_prefix: str
+
+    # Primary OCR runtime: 'paddle' (Paddle Inference) or 'onnx' (ONNX Runtime
+    # with PaddleOCR models exported to det.onnx/rec.onnx/cls.onnx in ocr_onnx_model_dir)
+    ocr_engine: str
+    ocr_onnx_model_dir: str
+    # 'int8' runs the ONNX recognition model with dynamically quantized weights
+    ocr_quantization: str
+
+
+def _load_config() -> Config:
+    """Read and coerce all environment variables in one place"""
+    env = os.environ
+    return Config(
+        supabase_url=env.get('SUPABASE_URL', ''),
+        supabase_service_role_key=env.get('SUPABASE_SERVICE_ROLE_KEY', ''),
+        r2_account_id=env.get('R2_ACCOUNT_ID', ''),
+        r2_access_key_id=env.get('R2_ACCESS_KEY_ID', ''),
+        r2_secret_access_key=env.get('R2_SECRET_ACCESS_KEY', ''),
+        r2_bucket_name=env.get('R2_BUCKET_NAME', 'flashread-documents'),
+        worker_id=env.get('WORKER_ID', 'worker-1'),
+        poll_interval_seconds=int(env.get('POLL_INTERVAL_SECONDS', '5')),
+        database_url=env.get('DATABASE_URL', ''),
+        job_notify_timeout_seconds=int(env.get('JOB_NOTIFY_TIMEOUT_SECONDS', '60')),
+        retry_backoff_base_seconds=float(env.get('RETRY_BACKOFF_BASE_SECONDS', '2')),
+        retry_backoff_cap_seconds=float(env.get('RETRY_BACKOFF_CAP_SECONDS', '300')),
+        ocr_dpi_initial=int(env.get('OCR_DPI_INITIAL', '200')),
+        ocr_dpi_rerun=int(env.get('OCR_DPI_RERUN', '300')),
+        ocr_min_confidence=float(env.get('OCR_MIN_CONFIDENCE', '0.6')),
+        ocr_min_chars_per_page=int(env.get('OCR_MIN_CHARS_PER_PAGE', '50')),
+        ocr_batch_size=int(env.get('OCR_BATCH_SIZE', '8')),
+        tesseract_lang=env.get('TESSERACT_LANG', 'eng'),
+        tessdata_prefix=env.get('TESSDATA_PREFIX', ''),
+        ocr_engine=env.get('OCR_ENGINE', 'paddle').lower(),
+        ocr_onnx_model_dir=env.get('OCR_ONNX_MODEL_DIR', ''),
+        ocr_quantization=env.get('OCR_QUANTIZATION', '').lower(),
+    )
 
-# OCR configuration (Phase 2b)
-OCR_DPI_INITIAL = int(os.getenv('OCR_DPI_INITIAL', '200'))
-OCR_DPI_RERUN = int(os.getenv('OCR_DPI_RERUN', '300'))
-OCR_MIN_CONFIDENCE = float(os.getenv('OCR_MIN_CONFIDENCE', '0.6'))
-OCR_MIN_CHARS_PER_PAGE = int(os.getenv('OCR_MIN_CHARS_PER_PAGE', '50'))
-TESSERACT_LANG = os.getenv('TESSERACT_LANG', 'eng')
+
+CFG = _load_config()
+
+# Module-level names (imported by name across the worker)
+SUPABASE_URL = CFG.supabase_url
+SUPABASE_SERVICE_ROLE_KEY = CFG.supabase_service_role_key
+
+R2_ACCOUNT_ID = CFG.r2_account_id
+R2_ACCESS_KEY_ID = CFG.r2_access_key_id
+R2_SECRET_ACCESS_KEY = CFG.r2_secret_access_key
+R2_BUCKET_NAME = CFG.r2_bucket_name
+
+WORKER_ID = CFG.worker_id
+POLL_INTERVAL_SECONDS = CFG.poll_interval_seconds
+
+DATABASE_URL = CFG.database_url
+JOB_NOTIFY_TIMEOUT_SECONDS = CFG.job_notify_timeout_seconds
+
+RETRY_BACKOFF_BASE_SECONDS = CFG.retry_backoff_base_seconds
+RETRY_BACKOFF_CAP_SECONDS = CFG.retry_backoff_cap_seconds
+
+OCR_DPI_INITIAL = CFG.ocr_dpi_initial
+OCR_DPI_RERUN = CFG.ocr_dpi_rerun
+OCR_MIN_CONFIDENCE = CFG.ocr_min_confidence
+OCR_MIN_CHARS_PER_PAGE = CFG.ocr_min_chars_per_page
+OCR_BATCH_SIZE = CFG.ocr_batch_size
+TESSERACT_LANG = CFG.tesseract_lang
+TESSDATA_PREFIX = CFG.tessdata_prefix
+OCR_ENGINE = CFG.ocr_engine
+OCR_ONNX_MODEL_DIR = CFG.ocr_onnx_model_dir
+OCR_QUANTIZATION = CFG.ocr_quantization
 
 # Validate required configuration
 def validate_config():
     """Ensure all required environment variables are set"""
     required_vars = {
-        'SUPABASE_URL': SUPABASE_URL,
-        'SUPABASE_SERVICE_ROLE_KEY': SUPABASE_SERVICE_ROLE_KEY,
-        'R2_ACCOUNT_ID': R2_ACCOUNT_ID,
-        'R2_ACCESS_KEY_ID': R2_ACCESS_KEY_ID,
-        'R2_SECRET_ACCESS_KEY': R2_SECRET_ACCESS_KEY,
+        'SUPABASE_URL': CFG.supabase_url,
+        'SUPABASE_SERVICE_ROLE_KEY': CFG.supabase_service_role_key,
+        'R2_ACCOUNT_ID': CFG.r2_account_id,
+        'R2_ACCESS_KEY_ID': CFG.r2_access_key_id,
+        'R2_SECRET_ACCESS_KEY': CFG.r2_secret_access_key,
     }
-    
+
     missing = [name for name, value in required_vars.items() if not value]
-    
+
     if missing:
         raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
-    
+
     print(f"✓ Configuration validated")
-    print(f"  Worker ID: {WORKER_ID}")
-    print(f"  Poll interval: {POLL_INTERVAL_SECONDS}s")
+    print(f"  Worker ID: {CFG.worker_id}")
+    if CFG.database_url:
+        print(f"  Job dispatch: LISTEN job_new (fallback poll {CFG.job_notify_timeout_seconds}s)")
+    else:
+        print(f"  Poll interval: {CFG.poll_interval_seconds}s")
     print(f"  Pipeline version: {PIPELINE_VERSION}")
-    print(f"  OCR DPI: {OCR_DPI_INITIAL} (initial), {OCR_DPI_RERUN} (rerun)")
+    print(f"  OCR DPI: {CFG.ocr_dpi_initial} (initial), {CFG.ocr_dpi_rerun} (rerun)")
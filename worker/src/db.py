@@ -1,35 +1,68 @@
+import io
+import time
+import random
 import httpx
 import boto3
+import psycopg
+from botocore.config import Config as BotoConfig
 from typing import Optional
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from .config import (
     SUPABASE_URL, 
     SUPABASE_SERVICE_ROLE_KEY,
     R2_ACCOUNT_ID,
     R2_ACCESS_KEY_ID,
     R2_SECRET_ACCESS_KEY,
-    R2_BUCKET_NAME
+    R2_BUCKET_NAME,
+    DATABASE_URL,
+    POLL_INTERVAL_SECONDS,
+    JOB_NOTIFY_TIMEOUT_SECONDS,
+    RETRY_BACKOFF_BASE_SECONDS,
+    RETRY_BACKOFF_CAP_SECONDS
 )
 from .models import DocumentJob, OcrVersion
+from .timestamps import utc_iso
 
 
+# Shared keep-alive pool for all PostgREST calls (avoids a TLS handshake per job)
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    http2=True,
+    timeout=10.0
+)
+
 # Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+supabase: Client = create_client(
+    SUPABASE_URL,
+    SUPABASE_SERVICE_ROLE_KEY,
+    options=ClientOptions(httpx_client=http_client)
+)
 
-# Initialize R2 client
+# Initialize R2 client (botocore keeps its own pooled connections)
 r2_client = boto3.client(
     's3',
     endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
     aws_access_key_id=R2_ACCESS_KEY_ID,
     aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-    region_name='auto'
+    region_name='auto',
+    config=BotoConfig(
+        max_pool_connections=32,
+        retries={'max_attempts': 3, 'mode': 'adaptive'},
+        tcp_keepalive=True
+    )
 )
 
 
+def backoff_delay(attempts: int, base: float, cap: float) -> float:
+    """Capped exponential backoff with full jitter, in seconds"""
+    return random.uniform(0, min(cap, base * 2 ** attempts))
+
+
 def claim_job(worker_id: str, job_types: list[str] = None) -> Optional[DocumentJob]:
     """
     Claim a pending job for processing.
-    Uses optimistic locking to prevent double-processing.
+    Uses the `claim_job` Postgres function (FOR UPDATE SKIP LOCKED) so the
+    select, claim, and document status update happen in a single round trip.
     
     Args:
         worker_id: Unique worker identifier
@@ -39,52 +72,15 @@ def claim_job(worker_id: str, job_types: list[str] = None) -> Optional[DocumentJ
     Returns:
         DocumentJob if claimed, None if no jobs available
     """
-    from datetime import datetime
-    
-    # Find oldest pending job, optionally filtered by job type
-    query = supabase.table('document_jobs')\
-        .select('*')\
-        .eq('status', 'pending')
-    
-    if job_types:
-        query = query.in_('job_type', job_types)
-    
-    response = query\
-        .order('priority', desc=True)\
-        .order('created_at', desc=False)\
-        .limit(1)\
-        .execute()
+    response = supabase.rpc('claim_job', {
+        'worker_id': worker_id,
+        'job_types': job_types or None
+    }).execute()
     
     if not response.data or len(response.data) == 0:
         return None
     
-    job_data = response.data[0]
-    
-    # Try to claim it atomically
-    now = datetime.utcnow().isoformat() + 'Z'
-    claim_response = supabase.table('document_jobs')\
-        .update({
-            'status': 'processing',
-            'locked_at': now,
-            'locked_by': worker_id,
-            'started_at': now,
-            'updated_at': now
-        })\
-        .eq('id', job_data['id'])\
-        .eq('status', 'pending')\
-        .execute()
-    
-    if not claim_response.data or len(claim_response.data) == 0:
-        # Job was claimed by another worker
-        return None
-    
-    # Update document status to processing
-    supabase.table('documents')\
-        .update({'status': 'processing', 'updated_at': now})\
-        .eq('id', job_data['document_id'])\
-        .execute()
-    
-    return DocumentJob(**claim_response.data[0])
+    return DocumentJob(**response.data[0])
 
 
 def complete_job(job_id: str, document_id: str, result: OcrVersion, final_status: str):
@@ -97,45 +93,45 @@ def complete_job(job_id: str, document_id: str, result: OcrVersion, final_status
         result: Extraction result
         final_status: 'ready' or 'pending_ocr'
     """
-    from datetime import datetime
-    now = datetime.utcnow().isoformat() + 'Z'
-    
-    # Update job
-    supabase.table('document_jobs')\
-        .update({
-            'status': 'completed',
-            'completed_at': now,
-            'updated_at': now,
-            'result': result.dict()
-        })\
-        .eq('id', job_id)\
-        .execute()
+    # Serialize the result tree once; it is stored on the job and in ocr_versions
+    payload = result.model_dump(mode='json')
     
     # Generate version key
-    version_key = f"{result.engine}_{result.engine_version}_{result.pipeline_version}_{int(datetime.utcnow().timestamp() * 1000)}"
+    version_key = f"{result.engine}_{result.engine_version}_{result.pipeline_version}_{int(time.time() * 1000)}"
     
-    # Get current ocr_versions
-    doc_response = supabase.table('documents')\
-        .select('ocr_versions')\
-        .eq('id', document_id)\
-        .single()\
-        .execute()
+    # Update job and merge into ocr_versions server-side in one round trip
+    supabase.rpc('complete_job', {
+        'job_id': job_id,
+        'document_id': document_id,
+        'result': payload,
+        'final_status': final_status,
+        'version_key': version_key,
+        'page_count': result.metrics.total_pages
+    }).execute()
+    
+    print(f"✓ Completed job {job_id} for document {document_id} with status {final_status}")
+
+
+def release_job(job_id: str):
+    """
+    Return a claimed but unprocessed job to the queue without counting an attempt.
     
-    current_versions = doc_response.data.get('ocr_versions', {}) if doc_response.data else {}
-    updated_versions = {**current_versions, version_key: result.dict()}
+    Args:
+        job_id: Job ID
+    """
+    now = utc_iso()
     
-    # Update document
-    supabase.table('documents')\
+    supabase.table('document_jobs')\
         .update({
-            'status': final_status,
-            'ocr_versions': updated_versions,
-            'page_count': result.metrics.total_pages,
+            'status': 'pending',
+            'locked_at': None,
+            'locked_by': None,
+            'started_at': None,
             'updated_at': now
         })\
-        .eq('id', document_id)\
+        .eq('id', job_id)\
+        .eq('status', 'processing')\
         .execute()
-    
-    print(f"✓ Completed job {job_id} for document {document_id} with status {final_status}")
 
 
 def fail_job(job_id: str, document_id: str, error_msg: str):
@@ -147,8 +143,7 @@ def fail_job(job_id: str, document_id: str, error_msg: str):
         document_id: Document ID
         error_msg: Error message
     """
-    from datetime import datetime
-    now = datetime.utcnow().isoformat() + 'Z'
+    now = utc_iso()
     
     # Get current job info
     job_response = supabase.table('document_jobs')\
@@ -165,6 +160,13 @@ def fail_job(job_id: str, document_id: str, error_msg: str):
     new_attempts = job['attempts'] + 1
     is_final_failure = new_attempts >= job['max_attempts']
     
+    # Requeued jobs are not claimable until locked_at (retry backoff);
+    # see claim_job in migration 00015_job_retry_backoff.sql
+    retry_at = None
+    if not is_final_failure:
+        delay = backoff_delay(new_attempts, RETRY_BACKOFF_BASE_SECONDS, RETRY_BACKOFF_CAP_SECONDS)
+        retry_at = utc_iso(delay)
+    
     # Update job
     supabase.table('document_jobs')\
         .update({
@@ -172,7 +174,7 @@ def fail_job(job_id: str, document_id: str, error_msg: str):
             'attempts': new_attempts,
             'last_error': error_msg,
             'updated_at': now,
-            'locked_at': None,
+            'locked_at': retry_at,
             'locked_by': None
         })\
         .eq('id', job_id)\
@@ -216,9 +218,69 @@ def download_pdf(document_id: str) -> bytes:
     
     storage_key = doc_response.data['storage_key']
     
-    # Download from R2
-    response = r2_client.get_object(Bucket=R2_BUCKET_NAME, Key=storage_key)
-    pdf_bytes = response['Body'].read()
+    # Stream from R2 into a single buffer. download_fileobj writes chunks as they
+    # arrive (ranged GETs for large files), and getvalue() hands back the
+    # buffer itself rather than a second copy of the PDF.
+    buf = io.BytesIO()
+    r2_client.download_fileobj(R2_BUCKET_NAME, storage_key, buf)
+    pdf_bytes = buf.getvalue()
+    del buf
     
     print(f"✓ Downloaded PDF for document {document_id} ({len(pdf_bytes)} bytes)")
     return pdf_bytes
+
+
+def _notify_timeout(conn: psycopg.Connection) -> float:
+    """
+    Seconds to wait for a job notification: JOB_NOTIFY_TIMEOUT_SECONDS, or
+    less if a requeued job's retry backoff (locked_at) runs out sooner.
+    
+    Args:
+        conn: Open direct Postgres connection (autocommit)
+        
+    Returns:
+        Timeout in seconds, never negative
+    """
+    row = conn.execute(
+        "SELECT EXTRACT(EPOCH FROM min(locked_at) - now()) "
+        "FROM public.document_jobs "
+        "WHERE status = 'pending' AND locked_at > now()"
+    ).fetchone()
+    
+    if row is None or row[0] is None:
+        return JOB_NOTIFY_TIMEOUT_SECONDS
+    return max(0.0, min(float(JOB_NOTIFY_TIMEOUT_SECONDS), float(row[0])))
+
+
+# Dedicated LISTEN connection (direct Postgres, not PostgREST), opened lazily
+_listen_conn: Optional[psycopg.Connection] = None
+
+
+def wait_for_job():
+    """
+    Block until a job may be available.
+    
+    With DATABASE_URL set, waits for a `job_new` notification (sent by the
+    document_jobs trigger on enqueue/requeue), returning early as soon as one
+    arrives and at most after JOB_NOTIFY_TIMEOUT_SECONDS as a safety poll.
+    Requeued jobs in retry backoff send no notification when they become
+    claimable, so the wait also ends when the earliest backoff expires.
+    Without DATABASE_URL, sleeps POLL_INTERVAL_SECONDS.
+    """
+    global _listen_conn
+    
+    if not DATABASE_URL:
+        time.sleep(POLL_INTERVAL_SECONDS)
+        return
+    
+    try:
+        if _listen_conn is None or _listen_conn.closed:
+            _listen_conn = psycopg.connect(DATABASE_URL, autocommit=True)
+            _listen_conn.execute('LISTEN job_new')
+        
+        for _ in _listen_conn.notifies(timeout=_notify_timeout(_listen_conn), stop_after=1):
+            pass
+    except psycopg.Error as e:
+        print(f"⚠ Job notification listener error: {e}")
+        _listen_conn = None
+        time.sleep(POLL_INTERVAL_SECONDS)
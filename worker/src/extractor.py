@@ -1,12 +1,101 @@
+import os
+import itertools
+import multiprocessing
 import fitz  # PyMuPDF
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from .models import OcrVersion, OcrPage, PageBlock, OcrMetrics
+from .ocr.classifier import classify_blocks_for_page
+from .timestamps import utc_iso
+
+
+# Below this page count, process startup costs more than it saves
+PARALLEL_MIN_PAGES = 32
+
+# get_text("blocks") block_type for text (1 = image)
+TEXT_BLOCK = 0
+
+# Default block flags plus dehyphenation, so words split across lines come
+# back joined instead of needing a Python-side fix-up pass
+BLOCK_TEXT_FLAGS = fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_DEHYPHENATE
+
+# Raw page layout: ([(x0, y0, x1, y1, text), ...], page_height, page_width)
+RawPage = Tuple[List[tuple], float, float]
+
+# Extraction workers start from the forkserver rather than forking the worker
+# itself, which already runs the job prefetch thread and HTTP/boto pools
+# (locks held by those threads at fork time would stay held in the child)
+_MP_CONTEXT = multiprocessing.get_context('forkserver')
+
+# PDF being extracted, set once per pool process by _init_range_worker
+_worker_pdf_bytes: Optional[bytes] = None
+
+
+# Resolved once; the version cannot change within a process
+PYMUPDF_VERSION = fitz.__version__
 
 
 def get_pymupdf_version() -> str:
     """Get PyMuPDF version"""
-    return fitz.__version__
+    return PYMUPDF_VERSION
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[RawPage]:
+    """
+    Extract text blocks for pages [start, stop) with a document handle of its own.
+    PyMuPDF documents are not thread-safe and hold the GIL, so parallel
+    extraction runs this in separate processes.
+    """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        raw_pages = []
+        for page_num in range(start, stop):
+            page = doc[page_num]
+            # (x0, y0, x1, y1, text, block_no, block_type) straight from MuPDF's parse
+            raw_blocks = [
+                b[:5] for b in page.get_text("blocks", flags=BLOCK_TEXT_FLAGS)
+                if b[6] == TEXT_BLOCK
+            ]
+            raw_pages.append((raw_blocks, page.rect.height, page.rect.width))
+        return raw_pages
+    finally:
+        doc.close()
+
+
+def _init_range_worker(pdf_bytes: bytes) -> None:
+    """Pool initializer: receive the PDF once per process instead of per task"""
+    global _worker_pdf_bytes
+    _worker_pdf_bytes = pdf_bytes
+
+
+def _extract_worker_range(start: int, stop: int) -> List[RawPage]:
+    """Extract pages [start, stop) of the PDF handed to this pool process"""
+    return _extract_page_range(_worker_pdf_bytes, start, stop)
+
+
+def _extract_raw_pages(pdf_bytes: bytes, page_count: int) -> List[RawPage]:
+    """
+    Extract text blocks for every page, splitting large documents into
+    contiguous page ranges across a process pool. Results are returned in
+    page order.
+    """
+    workers = min(os.cpu_count() or 1, page_count // PARALLEL_MIN_PAGES)
+    if workers <= 1:
+        return _extract_page_range(pdf_bytes, 0, page_count)
+    
+    chunk = -(-page_count // workers)  # ceil division
+    starts = list(range(0, page_count, chunk))
+    stops = [min(start + chunk, page_count) for start in starts]
+    
+    with ProcessPoolExecutor(
+        max_workers=len(starts),
+        mp_context=_MP_CONTEXT,
+        initializer=_init_range_worker,
+        initargs=(pdf_bytes,)
+    ) as ex:
+        ranges = ex.map(_extract_worker_range, starts, stops)
+        return [page for raw_pages in ranges for page in raw_pages]
 
 
 def extract_text_from_pdf(pdf_bytes: bytes) -> OcrVersion:
@@ -21,61 +110,66 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> OcrVersion:
         OcrVersion with extracted text and metadata
     """
     start_time = datetime.now()
+    created_at = utc_iso()
     
-    # Open PDF from bytes
+    # Open PDF from bytes (only needed for the page count)
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page_count = len(doc)
+    finally:
+        doc.close()
     
     pages: List[OcrPage] = []
     all_text_parts: List[str] = []
     total_chars = 0
     
-    try:
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            
-            # Extract text from page
-            page_text = page.get_text()
-            
-            # Create a single block for the entire page
-            # (PyMuPDF doesn't provide block-level structure easily in Phase 2a)
-            blocks: List[PageBlock] = []
-            if page_text.strip():
-                blocks.append(PageBlock(
-                    type='paragraph',
-                    text=page_text,
-                    confidence=None,  # Direct extraction has no confidence score
-                    bbox=None
-                ))
-            
-            pages.append(OcrPage(
-                page=page_num + 1,  # 1-indexed
-                blocks=blocks,
-                text=page_text,
-                raw_text=page_text,
-                confidence=None
-            ))
-            
-            all_text_parts.append(f"\n\n--- Page {page_num + 1} ---\n\n")
-            all_text_parts.append(page_text)
-            total_chars += len(page_text)
-    
-    finally:
-        doc.close()
+    for page_num, (raw_blocks, page_height, page_width) in enumerate(
+        _extract_raw_pages(pdf_bytes, page_count)
+    ):
+        # One block per layout block, classified by content and position.
+        # Plain dicts here; models are built once below without re-validation.
+        blocks = []
+        for x0, y0, x1, y1, text in raw_blocks:
+            # isspace() stops at the first non-space char without allocating;
+            # only blocks that are kept pay for strip()
+            if not text or text.isspace():
+                continue
+            blocks.append({
+                'type': 'paragraph',
+                'text': text.strip(),
+                'bbox': [x0, y0, x1 - x0, y1 - y0]
+            })
+        classify_blocks_for_page(blocks, page_height, page_width)
+        
+        page_text = '\n'.join(b['text'] for b in blocks)
+        
+        # Internally synthesized data, so skip validation with model_construct
+        pages.append(OcrPage.model_construct(
+            page=page_num + 1,  # 1-indexed
+            blocks=[PageBlock.model_construct(**b) for b in blocks],
+            text=page_text,
+            raw_text=page_text,
+            confidence=None
+        ))
+        
+        all_text_parts.append(page_text)
+        total_chars += len(page_text)
     
     end_time = datetime.now()
     runtime_ms = int((end_time - start_time).total_seconds() * 1000)
     
-    # Combine all text with page separators
-    doc_text = ''.join(all_text_parts)
+    # Combine all text with page separators (page_text is shared, not copied)
+    separators = (f"\n\n--- Page {i + 1} ---\n\n" for i in range(len(all_text_parts)))
+    doc_text = ''.join(itertools.chain.from_iterable(zip(separators, all_text_parts)))
     
-    return OcrVersion(
-        created_at=start_time.isoformat() + 'Z',
+    return OcrVersion.model_construct(
+        created_at=created_at,
         engine='pymupdf',
-        engine_version=get_pymupdf_version(),
+        engine_version=PYMUPDF_VERSION,
         pipeline_version='',  # Will be set by caller
         pages=pages,
         doc_text=doc_text,
-        metrics=OcrMetrics(
+        metrics=OcrMetrics.model_construct(
             total_pages=len(pages),
             method='direct',
             char_count=total_chars,
@@ -85,5 +179,5 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> OcrVersion:
         warnings=[],
         # Legacy fields
         model_name='pymupdf',
-        model_version=get_pymupdf_version()
+        model_version=PYMUPDF_VERSION
     )
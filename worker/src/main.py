@@ -1,12 +1,17 @@
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from .config import (
     validate_config, 
     WORKER_ID, 
     POLL_INTERVAL_SECONDS,
-    PIPELINE_VERSION
+    PIPELINE_VERSION,
+    DATABASE_URL,
+    RETRY_BACKOFF_CAP_SECONDS
+)
+from .db import (
+    claim_job, complete_job, fail_job, download_pdf, wait_for_job, release_job, backoff_delay
 )
-from .db import claim_job, complete_job, fail_job, download_pdf
 from .extractor import extract_text_from_pdf
 from .quality import is_extraction_sufficient
 
@@ -90,6 +95,45 @@ def handle_ocr_job(job, pdf_bytes):
     complete_job(job.id, job.document_id, result, final_status)
 
 
+def fetch_next_job():
+    """
+    Claim the next job and download its PDF.
+    Runs on the prefetch thread while the current job is being processed.
+    
+    The prefetched job is claimed immediately, so it sits in 'processing'
+    (locked_at set, locked_by this worker) until the current job finishes.
+    main() releases it on every exit from its loop. If the process dies
+    without unwinding (SIGKILL, OOM kill), the job stays orphaned until
+    stale-lock recovery requeues it (see "Documents Stuck in Processing"
+    in the README).
+    
+    Returns:
+        (job, pdf_bytes, download_error) - job is None if no jobs are available
+    """
+    # Try to claim any job type (extraction or OCR)
+    job = claim_job(WORKER_ID, job_types=None)
+    if not job:
+        return None, None, None
+    
+    try:
+        return job, download_pdf(job.document_id), None
+    except Exception as e:
+        return job, None, str(e)
+
+
+def release_prefetched_job(next_fetch):
+    """Put a job claimed by the prefetch thread back in the queue when the worker stops"""
+    if next_fetch is None or next_fetch.cancel():
+        return
+    try:
+        job, _, _ = next_fetch.result()
+        if job:
+            release_job(job.id)
+            print(f"   Released prefetched job {job.id}")
+    except Exception:
+        pass
+
+
 def main():
     """Main worker loop"""
     print("=" * 60)
@@ -103,33 +147,46 @@ def main():
         print(f"✗ Configuration error: {e}")
         sys.exit(1)
     
-    print(f"\n🚀 Worker started. Polling every {POLL_INTERVAL_SECONDS}s...")
+    if DATABASE_URL:
+        print("\n🚀 Worker started. Listening for new jobs...")
+    else:
+        print(f"\n🚀 Worker started. Polling every {POLL_INTERVAL_SECONDS}s...")
     print("   Supports: extraction (Phase 2a), OCR (Phase 2b)")
     print("   Press Ctrl+C to stop\n")
     
     job_count = 0
+    consecutive_errors = 0
+    
+    # Claim + download (network-bound) of the next job overlaps with processing
+    # (CPU-bound) of the current one. Still only one job is processed at a time.
+    prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+    next_fetch = prefetcher.submit(fetch_next_job)
     
     try:
         while True:
             try:
-                # Try to claim any job type (extraction or OCR)
-                job = claim_job(WORKER_ID, job_types=None)
+                # Detach the future before reading it: if the claim raised,
+                # the error handler must see no fetch pending and resubmit
+                fetch, next_fetch = next_fetch, None
+                job, pdf_bytes, download_error = fetch.result()
+                consecutive_errors = 0
                 
                 if not job:
-                    # No jobs available, wait and retry
-                    time.sleep(POLL_INTERVAL_SECONDS)
+                    # No jobs available, wait for a job_new notification (or poll)
+                    wait_for_job()
+                    next_fetch = prefetcher.submit(fetch_next_job)
                     continue
                 
+                # Start fetching the next job while this one runs
+                next_fetch = prefetcher.submit(fetch_next_job)
+                
                 job_count += 1
                 print(f"\n📄 Processing job {job.id} (#{job_count})")
                 print(f"   Document: {job.document_id}")
                 print(f"   Type: {job.job_type}")
                 
-                # Download PDF
-                try:
-                    pdf_bytes = download_pdf(job.document_id)
-                except Exception as e:
-                    fail_job(job.id, job.document_id, f"Failed to download PDF: {str(e)}")
+                if download_error:
+                    fail_job(job.id, job.document_id, f"Failed to download PDF: {download_error}")
                     continue
                 
                 # Route to appropriate handler based on job type
@@ -152,12 +209,20 @@ def main():
                 print(f"\n✗ Unexpected error: {e}")
                 import traceback
                 traceback.print_exc()
-                # Continue processing next job
-                time.sleep(POLL_INTERVAL_SECONDS)
+                # Back off (with jitter) on repeated errors, then continue with next job
+                time.sleep(backoff_delay(consecutive_errors, POLL_INTERVAL_SECONDS, RETRY_BACKOFF_CAP_SECONDS))
+                consecutive_errors += 1
+                if next_fetch is None:
+                    next_fetch = prefetcher.submit(fetch_next_job)
     
     except KeyboardInterrupt:
         print(f"\n\n⏹ Worker stopped after processing {job_count} jobs")
         sys.exit(0)
+    finally:
+        # Any exit from the loop (Ctrl+C or an error escaping it) hands the
+        # prefetched job back instead of leaving it claimed
+        release_prefetched_job(next_fetch)
+        prefetcher.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == '__main__':
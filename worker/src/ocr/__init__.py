@@ -9,18 +9,48 @@ This module handles OCR processing for documents that lack usable text layers:
 - Block classification for content filtering (headers, footers, captions, etc.)
 """
 
-from .renderer import render_page
-from .paddle_engine import PaddleEngine
-from .tesseract_engine import TesseractEngine
-from .router import process_document_ocr
-from .normalize import build_ocr_version
-from .quality import is_page_quality_ok, is_doc_ocr_sufficient
-from .classifier import classify_block, is_core_content, BlockType
+from importlib import import_module
+
+# Lightweight, imported eagerly (also used by the extraction path)
+from .classifier import classify_block, is_core_content, BlockType, CORE_BLOCK_TYPES
+from .blocks import OcrBlock
+
+# Heavy exports (PaddleOCR, Tesseract, rendering) load on first access (PEP 562),
+# so extraction-only jobs never pay the OCR engine import cost
+_LAZY_EXPORTS = {
+    'render_page': '.renderer',
+    'PdfRenderer': '.renderer',
+    'PaddleEngine': '.paddle_engine',
+    'TesseractEngine': '.tesseract_engine',
+    'OnnxOcrEngine': '.onnx_engine',
+    'create_ocr_engine': '.engines',
+    'process_document_ocr': '.router',
+    'build_ocr_version': '.normalize',
+    'is_page_quality_ok': '.quality',
+    'is_doc_ocr_sufficient': '.quality',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     'render_page',
+    'PdfRenderer',
     'PaddleEngine',
     'TesseractEngine',
+    'OnnxOcrEngine',
+    'create_ocr_engine',
     'process_document_ocr',
     'build_ocr_version',
     'is_page_quality_ok',
@@ -28,4 +58,6 @@ __all__ = [
     'classify_block',
     'is_core_content',
     'BlockType',
+    'CORE_BLOCK_TYPES',
+    'OcrBlock',
 ]
@@ -0,0 +1,23 @@
+"""
+Engine-independent OCR result types.
+Kept free of engine imports so consumers (quality checks, normalization)
+don't pull in PaddleOCR or Tesseract just to reference a block.
+"""
+
+from typing import Optional, Tuple
+
+
+class OcrBlock:
+    """Represents a text block detected by OCR"""
+    # No per-instance __dict__: pages can yield thousands of blocks
+    __slots__ = ('text', 'confidence', 'bbox')
+    
+    def __init__(
+        self,
+        text: str,
+        confidence: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None
+    ):
+        self.text = text
+        self.confidence = confidence
+        self.bbox = bbox  # (x, y, width, height)
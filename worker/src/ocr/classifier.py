@@ -4,7 +4,8 @@ Uses bounding box data and text patterns to classify OCR blocks.
 """
 
 import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 
@@ -95,12 +96,42 @@ FOOTNOTE_MARKER_PATTERNS = [
 RUNNING_HEADER_MAX_LENGTH = 80
 
 
+def _combine_patterns(patterns: list) -> re.Pattern:
+    """
+    Fuse a pattern list into one alternation so a single match call
+    replaces a Python-level loop. Per-pattern IGNORECASE is kept as a
+    scoped inline flag so case-sensitive alternatives stay case-sensitive.
+    """
+    return re.compile('|'.join(
+        f'(?i:{p.pattern})' if p.flags & re.IGNORECASE else f'(?:{p.pattern})'
+        for p in patterns
+    ))
+
+
+PAGE_NUMBER_RE = _combine_patterns(PAGE_NUMBER_PATTERNS)
+CAPTION_RE = _combine_patterns(CAPTION_PATTERNS)
+SECTION_HEADER_RE = _combine_patterns(SECTION_HEADER_PATTERNS)
+FOOTNOTE_MARKER_RE = _combine_patterns(FOOTNOTE_MARKER_PATTERNS)
+
+# All content patterns as one named alternation, in classify_block's priority
+# order, so a single match picks the content-based type for a block
+CONTENT_TYPE_RE = re.compile('|'.join(
+    f'(?P<{block_type}>{rx.pattern})'
+    for block_type, rx in (
+        (BlockType.PAGE_NUMBER, PAGE_NUMBER_RE),
+        (BlockType.CAPTION, CAPTION_RE),
+        (BlockType.SECTION_HEADER, SECTION_HEADER_RE),
+        (BlockType.FOOTNOTE, FOOTNOTE_MARKER_RE),
+    )
+))
+
+
 # ============================================================
 # Classification Functions
 # ============================================================
 
 def get_block_position(
-    bbox: Optional[Tuple[float, float, float, float]],
+    bbox: Optional[Sequence[float]],
     page_height: float,
     page_width: float
 ) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
@@ -109,6 +140,7 @@ def get_block_position(
     
     Args:
         bbox: Bounding box [x, y, width, height] in page coordinates
+              (any indexable: list or tuple, no conversion needed)
         page_height: Total page height
         page_width: Total page width
         
@@ -118,28 +150,72 @@ def get_block_position(
     if not bbox or page_height <= 0 or page_width <= 0:
         return None, None, None, None
     
-    x, y, w, h = bbox
-    
-    y_start = y / page_height
-    y_end = (y + h) / page_height
-    x_center = (x + w / 2) / page_width
-    width_ratio = w / page_width
+    y = bbox[1]
+    w = bbox[2]
     
-    return y_start, y_end, x_center, width_ratio
+    return (
+        y / page_height,                        # y_start
+        (y + bbox[3]) / page_height,            # y_end
+        (bbox[0] + w / 2) / page_width,         # x_center
+        w / page_width                          # width_ratio
+    )
+
+
+# First characters each pattern family can start with. Most paragraphs are
+# rejected by one set lookup before any regex runs. Only ASCII characters are
+# gated: \d and IGNORECASE also match some non-ASCII characters.
+_DIGITS = '0123456789'
+PAGE_NUMBER_FIRST_CHARS = frozenset(_DIGITS + '-[(Pp')
+CAPTION_FIRST_CHARS = frozenset('FfTtCcGgEePpDd')
+SECTION_HEADER_FIRST_CHARS = frozenset(_DIGITS + 'AaIiMmRrDdCcBbVXL')
+FOOTNOTE_MARKER_FIRST_CHARS = frozenset('[*')
+CONTENT_FIRST_CHARS = (
+    PAGE_NUMBER_FIRST_CHARS | CAPTION_FIRST_CHARS
+    | SECTION_HEADER_FIRST_CHARS | FOOTNOTE_MARKER_FIRST_CHARS
+)
+
+
+def _cannot_start(trimmed: str, first_chars: frozenset) -> bool:
+    """True if trimmed (non-empty) cannot match a pattern starting with first_chars"""
+    c = trimmed[0]
+    return c.isascii() and c not in first_chars
+
+
+# Running headers, page numbers and section titles repeat across pages, so
+# regex results are memoized on the stripped text. Only short texts are
+# cached: paragraphs are nearly always unique, so caching them would only
+# hash them and pin them in memory for the life of the worker.
+CLASSIFY_CACHE_SIZE = 8192
+CLASSIFY_CACHE_MAX_CHARS = 64
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def _matches_cached(pattern: re.Pattern, trimmed: str) -> bool:
+    """Cached pattern.match() on already-stripped short text"""
+    return pattern.match(trimmed) is not None
+
+
+def _matches(pattern: re.Pattern, trimmed: str) -> bool:
+    """pattern.match() on already-stripped text, memoized for short text"""
+    if len(trimmed) <= CLASSIFY_CACHE_MAX_CHARS:
+        return _matches_cached(pattern, trimmed)
+    return pattern.match(trimmed) is not None
 
 
 def is_page_number(text: str) -> bool:
     """Check if text is a page number"""
     trimmed = text.strip()
-    if len(trimmed) > 20:
+    if not trimmed or len(trimmed) > 20 or _cannot_start(trimmed, PAGE_NUMBER_FIRST_CHARS):
         return False
-    return any(p.match(trimmed) for p in PAGE_NUMBER_PATTERNS)
+    return _matches(PAGE_NUMBER_RE, trimmed)
 
 
 def is_caption(text: str) -> bool:
     """Check if text is a figure/table caption"""
     trimmed = text.strip()
-    return any(p.match(trimmed) for p in CAPTION_PATTERNS)
+    if not trimmed or _cannot_start(trimmed, CAPTION_FIRST_CHARS):
+        return False
+    return _matches(CAPTION_RE, trimmed)
 
 
 def is_section_header(text: str) -> bool:
@@ -147,13 +223,55 @@ def is_section_header(text: str) -> bool:
     trimmed = text.strip()
     if len(trimmed) > 100:
         return False
-    return any(p.match(trimmed) for p in SECTION_HEADER_PATTERNS)
+    return _matches(SECTION_HEADER_RE, trimmed)
 
 
 def is_footnote_marker(text: str) -> bool:
     """Check if text starts with a footnote marker"""
     trimmed = text.strip()
-    return any(p.match(trimmed) for p in FOOTNOTE_MARKER_PATTERNS)
+    return _matches(FOOTNOTE_MARKER_RE, trimmed)
+
+
+def classify_content(trimmed: str) -> Optional[str]:
+    """
+    Content-based classification of stripped text in a single regex pass.
+    
+    Args:
+        trimmed: Block text with surrounding whitespace removed
+        
+    Returns:
+        BlockType string, or None if no content pattern applies
+    """
+    if len(trimmed) <= CLASSIFY_CACHE_MAX_CHARS:
+        return _classify_content_cached(trimmed)
+    return _classify_content(trimmed)
+
+
+def _classify_content(trimmed: str) -> Optional[str]:
+    """Uncached classify_content"""
+    if not trimmed or _cannot_start(trimmed, CONTENT_FIRST_CHARS):
+        return None
+    
+    m = CONTENT_TYPE_RE.match(trimmed)
+    if m is None:
+        return None
+    
+    block_type = m.lastgroup
+    if (block_type == BlockType.PAGE_NUMBER and len(trimmed) > 20) or \
+            (block_type == BlockType.SECTION_HEADER and len(trimmed) > 100):
+        # Length guard rejected the winning pattern; fall back to ordered checks
+        if is_caption(trimmed):
+            return BlockType.CAPTION
+        if is_section_header(trimmed):
+            return BlockType.SECTION_HEADER
+        if is_footnote_marker(trimmed):
+            return BlockType.FOOTNOTE
+        return None
+    
+    return block_type
+
+
+_classify_content_cached = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(_classify_content)
 
 
 def is_short_centered_text(
@@ -180,7 +298,7 @@ def is_short_centered_text(
 
 def classify_block(
     text: str,
-    bbox: Optional[Tuple[float, float, float, float]] = None,
+    bbox: Optional[Sequence[float]] = None,
     page_height: float = 0,
     page_width: float = 0,
     thresholds: PositionThresholds = DEFAULT_THRESHOLDS
@@ -203,6 +321,10 @@ def classify_block(
     if not trimmed:
         return BlockType.OTHER
     
+    # Without position data only the (cached) content checks can apply
+    if not bbox:
+        return classify_content(trimmed) or BlockType.PARAGRAPH
+    
     # Get normalized position
     y_start, y_end, x_center, width_ratio = get_block_position(
         bbox, page_height, page_width
@@ -210,41 +332,33 @@ def classify_block(
     
     # ---- Content-based classification (high confidence) ----
     
-    # Check for page numbers
-    if is_page_number(trimmed):
-        return BlockType.PAGE_NUMBER
-    
-    # Check for captions
-    if is_caption(trimmed):
-        return BlockType.CAPTION
-    
-    # Check for section headers
-    if is_section_header(trimmed):
-        return BlockType.SECTION_HEADER
-    
-    # Check for footnote markers
-    if is_footnote_marker(trimmed):
-        return BlockType.FOOTNOTE
+    # Page numbers, captions, section headers, footnote markers
+    content_type = classify_content(trimmed)
+    if content_type is not None:
+        return content_type
     
     # ---- Position-based classification ----
     
     if y_start is not None:
+        footer_zone = thresholds.footer_zone
+        length = len(trimmed)
+        
         # Header zone (top of page)
         if y_start < thresholds.header_zone:
             # Short text at top is likely running header
-            if len(trimmed) < RUNNING_HEADER_MAX_LENGTH:
+            if length < RUNNING_HEADER_MAX_LENGTH:
                 return BlockType.HEADER
         
         # Footer zone (bottom of page)
-        if y_end > thresholds.footer_zone:
+        if y_end > footer_zone:
             # Short text at bottom is likely page number or running footer
-            if len(trimmed) < 30 and is_page_number(trimmed):
+            if length < 30 and is_page_number(trimmed):
                 return BlockType.PAGE_NUMBER
-            if len(trimmed) < RUNNING_HEADER_MAX_LENGTH:
+            if length < RUNNING_HEADER_MAX_LENGTH:
                 return BlockType.HEADER  # Running footer treated as header
         
         # Footnote zone (lower portion but not absolute bottom)
-        if y_start > thresholds.footnote_zone and y_end < thresholds.footer_zone:
+        if y_start > thresholds.footnote_zone and y_end < footer_zone:
             # Small text in footnote area with markers
             if is_footnote_marker(trimmed) or trimmed[0].isdigit():
                 return BlockType.FOOTNOTE
@@ -284,11 +398,10 @@ def classify_blocks_for_page(
         # Handle both dict and object access
         if hasattr(block, 'text'):
             text = block.text
-            bbox = tuple(block.bbox) if block.bbox else None
+            bbox = block.bbox
         else:
             text = block.get('text', '')
-            bbox_val = block.get('bbox')
-            bbox = tuple(bbox_val) if bbox_val else None
+            bbox = block.get('bbox')
         
         block_type = classify_block(
             text=text,
@@ -313,6 +426,15 @@ def classify_blocks_for_page(
 # Utility Functions
 # ============================================================
 
+# Block types that make up the readable text (built once, not per call)
+CORE_BLOCK_TYPES = frozenset({
+    BlockType.TITLE,
+    BlockType.SECTION_HEADER,
+    BlockType.PARAGRAPH,
+    BlockType.LIST,
+})
+
+
 def is_core_content(block_type: str) -> bool:
     """
     Check if a block type represents core readable content.
@@ -323,13 +445,7 @@ def is_core_content(block_type: str) -> bool:
     Returns:
         True if the block should be included in reading content
     """
-    core_types = {
-        BlockType.TITLE,
-        BlockType.SECTION_HEADER,
-        BlockType.PARAGRAPH,
-        BlockType.LIST,
-    }
-    return block_type in core_types
+    return block_type in CORE_BLOCK_TYPES
 
 
 def filter_core_content(blocks: list) -> list:
@@ -337,20 +453,15 @@ def filter_core_content(blocks: list) -> list:
     Filter blocks to only include core readable content.
     
     Args:
-        blocks: List of classified blocks
+        blocks: List of classified blocks (all PageBlock-like objects or all dicts)
         
     Returns:
         Filtered list containing only core content blocks
     """
-    result = []
-    
-    for block in blocks:
-        if hasattr(block, 'type'):
-            block_type = block.type
-        else:
-            block_type = block.get('type', BlockType.PARAGRAPH)
-        
-        if is_core_content(block_type):
-            result.append(block)
+    if not blocks:
+        return []
     
-    return result
+    # Pick the accessor once instead of probing every block
+    if hasattr(blocks[0], 'type'):
+        return [block for block in blocks if block.type in CORE_BLOCK_TYPES]
+    return [block for block in blocks if block.get('type', BlockType.PARAGRAPH) in CORE_BLOCK_TYPES]
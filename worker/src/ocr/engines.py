@@ -0,0 +1,42 @@
+"""
+Primary OCR engine selection.
+Picks the PaddleOCR runtime from configuration (OCR_ENGINE).
+"""
+
+from .paddle_engine import PaddleEngine
+from ..config import OCR_ENGINE, OCR_ONNX_MODEL_DIR, OCR_QUANTIZATION
+
+
+def create_ocr_engine(lang: str = 'en', use_angle_cls: bool = True) -> PaddleEngine:
+    """
+    Create the primary OCR engine selected by OCR_ENGINE.
+    
+    Args:
+        lang: Language code (default 'en')
+        use_angle_cls: Enable angle classification for rotated text
+        
+    Returns:
+        PaddleEngine ('paddle') or OnnxOcrEngine ('onnx')
+        
+    Raises:
+        ValueError: If OCR_ENGINE is unknown or the ONNX model dir is not set
+    """
+    if OCR_ENGINE == 'paddle':
+        if OCR_QUANTIZATION:
+            print(f"   ⚠ OCR_QUANTIZATION={OCR_QUANTIZATION} only applies to OCR_ENGINE=onnx, ignoring")
+        return PaddleEngine(lang=lang, use_angle_cls=use_angle_cls)
+    
+    if OCR_ENGINE == 'onnx':
+        if not OCR_ONNX_MODEL_DIR:
+            raise ValueError("OCR_ENGINE=onnx requires OCR_ONNX_MODEL_DIR")
+        
+        # Imported here so the default engine never loads onnxruntime
+        from .onnx_engine import OnnxOcrEngine
+        return OnnxOcrEngine(
+            OCR_ONNX_MODEL_DIR,
+            lang=lang,
+            use_angle_cls=use_angle_cls,
+            quantization=OCR_QUANTIZATION
+        )
+    
+    raise ValueError(f"Unknown OCR_ENGINE: {OCR_ENGINE!r} (expected 'paddle' or 'onnx')")
@@ -4,28 +4,28 @@ Converts PaddleOCR and Tesseract outputs into the OcrVersion schema.
 """
 
 from typing import List, Optional
-from datetime import datetime
 import sys
 sys.path.append('..')
 from ..models import OcrVersion, OcrPage, PageBlock, OcrMetrics
-from .paddle_engine import OcrBlock
-from .classifier import classify_block, is_core_content
+from ..timestamps import utc_iso
+from .blocks import OcrBlock
+from .classifier import classify_block, CORE_BLOCK_TYPES
 
 
-def normalize_paddle_output(
+def _normalize_output(
     blocks: List[OcrBlock],
-    page_height: float = 0,
-    page_width: float = 0,
-    classify: bool = True
+    page_height: float,
+    page_width: float,
+    classify: bool
 ) -> List[PageBlock]:
     """
-    Normalize PaddleOCR blocks to PageBlock schema.
+    Normalize engine blocks to PageBlock schema (shared by all engines).
     
     Args:
-        blocks: List of OcrBlock objects from PaddleOCR
+        blocks: List of OcrBlock objects from any OCR engine
         page_height: Page height for position-based classification
         page_width: Page width for position-based classification
-        classify: Whether to classify blocks (default True)
+        classify: Whether to classify blocks
         
     Returns:
         List of PageBlock objects conforming to schema
@@ -33,11 +33,17 @@ def normalize_paddle_output(
     page_blocks = []
     
     for block in blocks:
+        text = block.text
+        if not text:
+            # Empty detections carry nothing to read or classify
+            continue
+        bbox = block.bbox
+        
         # Determine block type
         if classify:
             block_type = classify_block(
-                text=block.text,
-                bbox=tuple(block.bbox) if block.bbox else None,
+                text=text,
+                bbox=bbox or None,
                 page_height=page_height,
                 page_width=page_width
             )
@@ -46,14 +52,35 @@ def normalize_paddle_output(
         
         page_blocks.append(PageBlock(
             type=block_type,
-            text=block.text,
+            text=text,
             confidence=block.confidence,
-            bbox=block.bbox
+            bbox=bbox
         ))
     
     return page_blocks
 
 
+def normalize_paddle_output(
+    blocks: List[OcrBlock],
+    page_height: float = 0,
+    page_width: float = 0,
+    classify: bool = True
+) -> List[PageBlock]:
+    """
+    Normalize PaddleOCR blocks to PageBlock schema.
+    
+    Args:
+        blocks: List of OcrBlock objects from PaddleOCR
+        page_height: Page height for position-based classification
+        page_width: Page width for position-based classification
+        classify: Whether to classify blocks (default True)
+        
+    Returns:
+        List of PageBlock objects conforming to schema
+    """
+    return _normalize_output(blocks, page_height, page_width, classify)
+
+
 def normalize_tesseract_output(
     blocks: List[OcrBlock],
     page_height: float = 0,
@@ -72,28 +99,7 @@ def normalize_tesseract_output(
     Returns:
         List of PageBlock objects conforming to schema
     """
-    page_blocks = []
-    
-    for block in blocks:
-        # Determine block type
-        if classify:
-            block_type = classify_block(
-                text=block.text,
-                bbox=tuple(block.bbox) if block.bbox else None,
-                page_height=page_height,
-                page_width=page_width
-            )
-        else:
-            block_type = 'paragraph'
-        
-        page_blocks.append(PageBlock(
-            type=block_type,
-            text=block.text,
-            confidence=block.confidence,
-            bbox=block.bbox
-        ))
-    
-    return page_blocks
+    return _normalize_output(blocks, page_height, page_width, classify)
 
 
 def build_ocr_version(
@@ -130,38 +136,39 @@ def build_ocr_version(
     Returns:
         Complete OcrVersion object
     """
-    # Calculate total characters
+    # Single pass: total characters, running confidence sum, and doc_text parts.
+    # doc_text_parts holds the block strings themselves interleaved with
+    # separators, so the document is copied once by the final join instead of
+    # first into per-page strings and then again into doc_text.
+    # Note: We don't include page separators anymore as they pollute RSVP reading
     char_count = 0
-    all_confidences = []
+    conf_sum = 0.0
+    conf_n = 0
+    doc_text_parts = []
+    append = doc_text_parts.append
+    core_types = CORE_BLOCK_TYPES  # Local lookup; membership test instead of a call per block
     
     for page in pages:
+        # Pages are joined with double newline (paragraph break), blocks with one
+        sep = '\n\n'
         for block in page.blocks:
-            char_count += len(block.text)
-            if block.confidence is not None:
-                all_confidences.append(block.confidence)
+            text = block.text
+            char_count += len(text)
+            conf = block.confidence
+            if conf is not None:
+                conf_sum += conf
+                conf_n += 1
+            # If filtering, only include core content types
+            if not filter_doc_text or block.type in core_types:
+                append(sep)
+                append(text)
+                sep = '\n'
     
     # Calculate average confidence
-    avg_conf = sum(all_confidences) / len(all_confidences) if all_confidences else None
-    
-    # Build doc_text - optionally filter to core content only
-    # Note: We don't include page separators anymore as they pollute RSVP reading
-    doc_text_parts = []
-    for page in pages:
-        page_blocks = []
-        for block in page.blocks:
-            # If filtering, only include core content types
-            if filter_doc_text:
-                if is_core_content(block.type):
-                    page_blocks.append(block.text)
-            else:
-                page_blocks.append(block.text)
-        
-        if page_blocks:
-            page_text = '\n'.join(page_blocks)
-            doc_text_parts.append(page_text)
+    avg_conf = conf_sum / conf_n if conf_n else None
     
-    # Join pages with double newline (paragraph break)
-    doc_text = '\n\n'.join(doc_text_parts)
+    # Drop the page break in front of the first block
+    doc_text = ''.join(doc_text_parts[1:])
     
     # Build metrics
     metrics = OcrMetrics(
@@ -178,7 +185,7 @@ def build_ocr_version(
     
     # Create OcrVersion
     return OcrVersion(
-        created_at=datetime.utcnow().isoformat() + 'Z',
+        created_at=utc_iso(),
         engine=engine,
         engine_version=engine_version,
         pipeline_version=pipeline_version,
@@ -206,7 +213,8 @@ def merge_blocks_to_text(
     Returns:
         Merged text
     """
+    # str.join pre-sizes its result from a list; a generator is materialized first
     if core_only:
-        filtered = [b for b in blocks if is_core_content(b.type)]
-        return '\n'.join(block.text for block in filtered)
-    return '\n'.join(block.text for block in blocks)
+        core_types = CORE_BLOCK_TYPES
+        return '\n'.join([block.text for block in blocks if block.type in core_types])
+    return '\n'.join([block.text for block in blocks])
@@ -3,28 +3,17 @@ PaddleOCR engine wrapper for OCR processing.
 Uses PaddleOCR in CPU mode as the primary OCR engine.
 """
 
+import os
 import numpy as np
 from typing import Optional, List, Tuple
 from paddleocr import PaddleOCR
 import logging
+from .blocks import OcrBlock
 
 # Suppress PaddleOCR verbose logging
 logging.getLogger('ppocr').setLevel(logging.ERROR)
 
 
-class OcrBlock:
-    """Represents a text block detected by OCR"""
-    def __init__(
-        self,
-        text: str,
-        confidence: Optional[float] = None,
-        bbox: Optional[List[float]] = None
-    ):
-        self.text = text
-        self.confidence = confidence
-        self.bbox = bbox  # [x, y, width, height]
-
-
 class PaddleEngine:
     """
     PaddleOCR wrapper for CPU-based OCR processing.
@@ -33,16 +22,30 @@ class PaddleEngine:
     the initialization cost.
     """
     
-    def __init__(self, lang: str = 'en', use_angle_cls: bool = True):
+    def __init__(
+        self,
+        lang: str = 'en',
+        use_angle_cls: bool = True,
+        rec_batch_num: int = 16,
+        cpu_threads: Optional[int] = None,
+        enable_mkldnn: bool = True,
+        **ocr_options
+    ):
         """
         Initialize PaddleOCR engine.
         
         Args:
             lang: Language code (default 'en')
             use_angle_cls: Enable angle classification for rotated text
+            rec_batch_num: Text-line crops recognized per inference call
+            cpu_threads: Inference threads (default half the cores, leaving
+                room for the render thread and Tesseract)
+            enable_mkldnn: Use oneDNN (MKL-DNN) kernels on x86 CPUs
+            **ocr_options: Extra PaddleOCR arguments (e.g. model dirs, use_onnx)
         """
         self.lang = lang
         self.use_angle_cls = use_angle_cls
+        self._version = self._detect_version()
         
         # Initialize PaddleOCR in CPU mode
         self.ocr = PaddleOCR(
@@ -51,55 +54,99 @@ class PaddleEngine:
             use_gpu=False,
             show_log=False,
             use_mp=False,  # Disable multiprocessing for simpler deployment
+            rec_batch_num=rec_batch_num,  # Batch recognition crops (default 6)
+            cls_batch_num=rec_batch_num,
+            cpu_threads=cpu_threads or max(1, (os.cpu_count() or 2) // 2),
+            enable_mkldnn=enable_mkldnn,
+            **ocr_options
         )
+        
+        self._warmup()
+    
+    def _warmup(self):
+        """
+        Run tiny inferences so model loading and kernel setup happen here
+        instead of on the first page.
+        """
+        try:
+            blank = np.zeros((32, 128, 3), dtype=np.uint8)
+            # Detection only sees a blank page, so also push the crop through
+            # the classifier and recognizer directly
+            self.ocr.ocr(blank, cls=self.use_angle_cls)
+            self.ocr.ocr(blank, det=False, cls=self.use_angle_cls)
+        except Exception as e:
+            print(f"PaddleOCR warmup failed: {e}")
     
     def ocr_image(self, img: np.ndarray) -> List[OcrBlock]:
         """
         Run OCR on an image.
         
         Args:
-            img: Image as numpy array (H x W x 3, RGB)
+            img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
             
         Returns:
             List of OcrBlock objects with text, confidence, and bbox
         """
         try:
-            # PaddleOCR expects RGB numpy array
+            # PaddleOCR converts single-channel arrays to 3 channels itself
             result = self.ocr.ocr(img, cls=self.use_angle_cls)
             
-            if not result or not result[0]:
+            if not result:
                 return []
             
-            blocks = []
-            for line in result[0]:
-                # PaddleOCR returns: [bbox_coords, (text, confidence)]
-                bbox_coords = line[0]  # [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-                text, confidence = line[1]
-                
-                # Convert bbox to [x, y, width, height] format
-                x_coords = [pt[0] for pt in bbox_coords]
-                y_coords = [pt[1] for pt in bbox_coords]
-                x = min(x_coords)
-                y = min(y_coords)
-                width = max(x_coords) - x
-                height = max(y_coords) - y
-                
-                bbox = [x, y, width, height]
-                
-                blocks.append(OcrBlock(
-                    text=text.strip(),
-                    confidence=float(confidence),
-                    bbox=bbox
-                ))
-            
-            return blocks
+            return self._parse_page_result(result[0])
             
         except Exception as e:
             print(f"PaddleOCR error: {e}")
             return []
     
+    def ocr_images(self, imgs: List[np.ndarray]) -> List[List[OcrBlock]]:
+        """
+        Run OCR on several page images, one ocr_image call per page.
+        
+        This is a convenience loop, not a batched inference call: PaddleOCR
+        2.7 only accepts a list of images with detection disabled, so text
+        detection runs once per page. The only batching is inside each page,
+        where its recognition crops are run rec_batch_num at a time. Cost
+        grows linearly with the number of pages however they are grouped.
+        
+        Args:
+            imgs: Images as numpy arrays (H x W grayscale or H x W x 3 RGB)
+            
+        Returns:
+            One list of OcrBlock objects per input image, in order
+        """
+        return [self.ocr_image(img) for img in imgs]
+    
+    def _parse_page_result(self, page_result) -> List[OcrBlock]:
+        """Convert PaddleOCR's per-page result into OcrBlock objects"""
+        if not page_result:
+            return []
+        
+        # PaddleOCR returns lines of: [bbox_coords, (text, confidence)]
+        # with bbox_coords = [[x1,y1], [x2,y2], [x3,y3], [x4,y4]].
+        # Reduce all quads at once: (N, 4, 2) -> per-line min corner and extent
+        quads = np.asarray([line[0] for line in page_result], dtype=np.float64)
+        mins = quads.min(axis=1)
+        sizes = quads.max(axis=1) - mins
+        
+        # Convert bbox to (x, y, width, height) format
+        return [
+            OcrBlock(
+                text=text.strip(),
+                confidence=float(confidence),
+                bbox=(x, y, width, height)
+            )
+            for (_, (text, confidence)), (x, y), (width, height)
+            in zip(page_result, mins.tolist(), sizes.tolist())
+        ]
+    
     def get_version(self) -> str:
-        """Get PaddleOCR version"""
+        """Get PaddleOCR version (looked up once at construction)"""
+        return self._version
+    
+    def _detect_version(self) -> str:
+        """Look up the PaddleOCR version"""
         try:
             import paddleocr
             return paddleocr.__version__
@@ -116,14 +163,15 @@ class PaddleEngine:
         Returns:
             Average confidence (0-1) or None if no blocks
         """
-        if not blocks:
-            return None
-        
-        confidences = [b.confidence for b in blocks if b.confidence is not None]
-        if not confidences:
-            return None
+        total = 0.0
+        n = 0
+        for b in blocks:
+            confidence = b.confidence
+            if confidence is not None:
+                total += confidence
+                n += 1
         
-        return sum(confidences) / len(confidences)
+        return total / n if n else None
     
     def calculate_page_char_count(self, blocks: List[OcrBlock]) -> int:
         """
@@ -135,4 +183,4 @@ class PaddleEngine:
         Returns:
             Total character count
         """
-        return sum(len(b.text) for b in blocks)
+        return sum(map(len, [b.text for b in blocks]))
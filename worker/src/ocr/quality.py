@@ -3,10 +3,35 @@ OCR quality checks and heuristics for Phase 2b.
 Determines when pages need reprocessing or fallback engines.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import sys
 sys.path.append('..')
-from .paddle_engine import OcrBlock
+from .blocks import OcrBlock
+
+# Characters that don't count toward the non-whitespace ratio
+_WHITESPACE_CHARS = (' ', '\n', '\t', '\r')
+
+
+def _page_totals(blocks: List[OcrBlock]) -> Tuple[int, float, int]:
+    """
+    Reduce a page's blocks in one pass.
+    
+    Args:
+        blocks: List of OcrBlock objects
+        
+    Returns:
+        (char_count, confidence_sum, confidence_count) tuple
+    """
+    char_count = 0
+    conf_sum = 0.0
+    conf_n = 0
+    for b in blocks:
+        char_count += len(b.text)
+        conf = b.confidence
+        if conf is not None:
+            conf_sum += conf
+            conf_n += 1
+    return char_count, conf_sum, conf_n
 
 
 def is_page_quality_ok(
@@ -32,17 +57,15 @@ def is_page_quality_ok(
     if not blocks:
         return False
     
-    # Calculate total character count
-    char_count = sum(len(b.text) for b in blocks)
+    char_count, conf_sum, conf_n = _page_totals(blocks)
+    
+    # Check total character count
     if char_count < min_chars:
         return False
     
-    # Calculate average confidence (if available)
-    confidences = [b.confidence for b in blocks if b.confidence is not None]
-    if confidences:
-        avg_conf = sum(confidences) / len(confidences)
-        if avg_conf < min_conf:
-            return False
+    # Check average confidence (if available)
+    if conf_n and conf_sum / conf_n < min_conf:
+        return False
     
     return True
 
@@ -73,11 +96,9 @@ def is_doc_ocr_sufficient(text: str, page_count: int) -> bool:
         return False
     
     # Check non-whitespace ratio (filter out PDFs with only spaces/newlines)
-    text_without_ws = text.replace(' ', '').replace('\n', '').replace('\t', '').replace('\r', '')
-    if len(text) == 0:
-        return False
-    
-    non_ws_ratio = len(text_without_ws) / len(text)
+    # str.count scans in C without building stripped copies of the text
+    ws_count = sum(map(text.count, _WHITESPACE_CHARS))
+    non_ws_ratio = (char_count - ws_count) / char_count
     
     return non_ws_ratio > 0.5
 
@@ -92,10 +113,8 @@ def calculate_page_stats(blocks: List[OcrBlock]) -> dict:
     Returns:
         Dictionary with char_count, avg_conf, block_count
     """
-    char_count = sum(len(b.text) for b in blocks)
-    
-    confidences = [b.confidence for b in blocks if b.confidence is not None]
-    avg_conf = sum(confidences) / len(confidences) if confidences else None
+    char_count, conf_sum, conf_n = _page_totals(blocks)
+    avg_conf = conf_sum / conf_n if conf_n else None
     
     return {
         'char_count': char_count,
@@ -1,25 +1,93 @@
 """
 PDF page rendering to images for OCR processing.
 Uses PyMuPDF (fitz) to render pages at specified DPI.
+
+Pages are rendered as 8-bit grayscale: OCR only needs luminance, and a
+single channel is a third of the bytes to rasterize, copy and preprocess.
+Both OCR engines accept H x W arrays (PaddleOCR expands them internally).
 """
 
+import queue
+import threading
+from functools import lru_cache
 import fitz  # PyMuPDF
 import numpy as np
-from typing import Optional
+from typing import Optional, Iterable, Iterator, Tuple
 from PIL import Image
 
+# Sentinel marking the end of a prefetch stream
+_DONE = object()
+
+
+class _PixmapBuffer:
+    """
+    Exposes a grayscale Pixmap's sample buffer to numpy without copying.
+    
+    numpy keeps a reference to this object as the array's base, so the
+    Pixmap (and its buffer) lives as long as any view of the image does.
+    """
+    def __init__(self, pix: fitz.Pixmap):
+        self.pix = pix
+        self.__array_interface__ = {
+            'shape': (pix.height, pix.width),
+            'strides': (pix.stride, 1),
+            'typestr': '|u1',
+            'data': (pix.samples_ptr, True),  # Read-only, like the old bytes-backed array
+            'version': 3,
+        }
+
+
+@lru_cache(maxsize=8)
+def _dpi_matrix(dpi: int) -> fitz.Matrix:
+    """Zoom matrix for a DPI (PyMuPDF default is 72 DPI, so zoom = dpi / 72)"""
+    zoom = dpi / 72.0
+    return fitz.Matrix(zoom, zoom)
+
+
+def render_page_from_doc(doc: fitz.Document, page_num: int, dpi: int = 200) -> np.ndarray:
+    """
+    Render a page of an already opened PDF to an image array.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_num: Page number (0-indexed)
+        dpi: Rendering resolution (default 200)
+        
+    Returns:
+        Read-only numpy array in grayscale format (H x W), backed by the
+        rendered pixmap's buffer
+        
+    Raises:
+        ValueError: If page number is invalid
+    """
+    if page_num < 0 or page_num >= len(doc):
+        raise ValueError(f"Invalid page number {page_num}. Document has {len(doc)} pages.")
+    
+    page = doc[page_num]
+    
+    # Render page to a single-channel pixmap (zoom matrix cached per DPI)
+    pix = page.get_pixmap(matrix=_dpi_matrix(dpi), colorspace=fitz.csGRAY, alpha=False)
+    
+    # Wrap the pixmap's own buffer (one byte per pixel) without copying it;
+    # pix.samples would first copy the whole page into a bytes object, and
+    # a samples_mv view would not keep the pixmap alive
+    return np.asarray(_PixmapBuffer(pix))
+
 
 def render_page(pdf_bytes: bytes, page_num: int, dpi: int = 200) -> np.ndarray:
     """
     Render a PDF page to an image array for OCR processing.
     
+    Opens the PDF for this one page; prefer render_page_from_doc when
+    rendering several pages of the same document.
+    
     Args:
         pdf_bytes: PDF file bytes
         page_num: Page number (0-indexed)
         dpi: Rendering resolution (default 200)
         
     Returns:
-        numpy array in RGB format (H x W x 3)
+        numpy array in grayscale format (H x W)
         
     Raises:
         ValueError: If page number is invalid
@@ -28,28 +96,97 @@ def render_page(pdf_bytes: bytes, page_num: int, dpi: int = 200) -> np.ndarray:
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     
     try:
-        if page_num < 0 or page_num >= len(doc):
-            raise ValueError(f"Invalid page number {page_num}. Document has {len(doc)} pages.")
-        
-        page = doc[page_num]
-        
-        # Calculate zoom factor for desired DPI
-        # PyMuPDF default is 72 DPI, so zoom = target_dpi / 72
-        zoom = dpi / 72.0
-        mat = fitz.Matrix(zoom, zoom)
-        
-        # Render page to pixmap
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        
-        # Convert pixmap to numpy array
-        # PyMuPDF returns RGB by default when alpha=False
-        img_data = np.frombuffer(pix.samples, dtype=np.uint8)
-        img_array = img_data.reshape(pix.height, pix.width, 3)
+        return render_page_from_doc(doc, page_num, dpi)
+    finally:
+        doc.close()
+
+
+def iter_rendered_pages(
+    doc: fitz.Document,
+    page_nums: Optional[Iterable[int]] = None,
+    dpi: int = 200
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Render pages of an open PDF one at a time.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_nums: Page numbers (0-indexed) to render, in order (default all pages)
+        dpi: Rendering resolution (default 200)
         
-        return img_array
+    Yields:
+        (page_num, numpy array in grayscale format) tuples
+    """
+    if page_nums is None:
+        page_nums = range(len(doc))
+    
+    for page_num in page_nums:
+        yield page_num, render_page_from_doc(doc, page_num, dpi)
+
+
+def prefetch_rendered_pages(
+    doc: fitz.Document,
+    page_nums: Optional[Iterable[int]] = None,
+    dpi: int = 200,
+    buffer_size: int = 16
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Render pages on a background thread while the caller consumes them.
+    
+    Overlaps rasterization with OCR: the renderer works ahead of the consumer
+    into a bounded queue (backpressure caps memory at buffer_size images).
+    A single render thread is used because a fitz document is not thread-safe;
+    the caller must not use doc until the generator is exhausted or closed.
+    Closing the generator (or leaving it via an exception) stops and joins the
+    render thread, so close it before closing doc.
+    
+    Args:
+        doc: Open PyMuPDF document
+        page_nums: Page numbers (0-indexed) to render, in order (default all pages)
+        dpi: Rendering resolution (default 200)
+        buffer_size: Maximum rendered pages waiting to be consumed
         
+    Yields:
+        (page_num, numpy array in grayscale format) tuples, in page_nums order
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        # Give up if the consumer stopped early, instead of blocking forever
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iter_rendered_pages(doc, page_nums, dpi):
+                if not put(item):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(_DONE)
+    
+    render_thread = threading.Thread(target=produce, name='render', daemon=True)
+    render_thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
     finally:
-        doc.close()
+        # Wait out the page being rendered so doc is free once the generator
+        # is closed (the caller may close the document right after)
+        stop.set()
+        render_thread.join()
 
 
 def render_all_pages(pdf_bytes: bytes, dpi: int = 200) -> list[np.ndarray]:
@@ -61,27 +198,12 @@ def render_all_pages(pdf_bytes: bytes, dpi: int = 200) -> list[np.ndarray]:
         dpi: Rendering resolution (default 200)
         
     Returns:
-        List of numpy arrays (one per page) in RGB format
+        List of numpy arrays (one per page) in grayscale format
     """
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     
     try:
-        page_count = len(doc)
-        images = []
-        
-        zoom = dpi / 72.0
-        mat = fitz.Matrix(zoom, zoom)
-        
-        for page_num in range(page_count):
-            page = doc[page_num]
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            
-            img_data = np.frombuffer(pix.samples, dtype=np.uint8)
-            img_array = img_data.reshape(pix.height, pix.width, 3)
-            images.append(img_array)
-        
-        return images
-        
+        return [img for _, img in iter_rendered_pages(doc, dpi=dpi)]
     finally:
         doc.close()
 
@@ -101,3 +223,58 @@ def get_page_count(pdf_bytes: bytes) -> int:
         return len(doc)
     finally:
         doc.close()
+
+
+class PdfRenderer:
+    """
+    Renders pages of one PDF, parsing it once for all renders.
+    
+    Usage:
+        with PdfRenderer(pdf_bytes) as renderer:
+            img = renderer.render(0, dpi=300)
+    """
+    
+    def __init__(self, pdf_bytes: bytes):
+        """
+        Open the PDF.
+        
+        Args:
+            pdf_bytes: PDF file bytes
+        """
+        self.doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the PDF"""
+        return len(self.doc)
+    
+    def render(self, page_num: int, dpi: int = 200) -> np.ndarray:
+        """Render one page (see render_page_from_doc)"""
+        return render_page_from_doc(self.doc, page_num, dpi)
+    
+    def iter_pages(
+        self,
+        page_nums: Optional[Iterable[int]] = None,
+        dpi: int = 200
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Render pages in order on the calling thread (see iter_rendered_pages)"""
+        return iter_rendered_pages(self.doc, page_nums, dpi)
+    
+    def prefetch(
+        self,
+        page_nums: Optional[Iterable[int]] = None,
+        dpi: int = 200,
+        buffer_size: int = 16
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Render pages ahead on a background thread (see prefetch_rendered_pages)"""
+        return prefetch_rendered_pages(self.doc, page_nums, dpi, buffer_size)
+    
+    def close(self):
+        """Release the document"""
+        self.doc.close()
+    
+    def __enter__(self) -> 'PdfRenderer':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
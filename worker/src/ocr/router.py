@@ -3,28 +3,46 @@ OCR orchestration router with adaptive rerendering.
 Implements the Phase 2b pipeline logic.
 """
 
-from typing import List, Optional, Dict
+from contextlib import closing
+from typing import List, Optional, Dict, Iterable, Iterator
 from datetime import datetime
+import numpy as np
 import sys
 sys.path.append('..')
 from ..models import OcrVersion, OcrPage, PageBlock
-from .renderer import render_page, get_page_count
+from .renderer import PdfRenderer
 from .paddle_engine import PaddleEngine
+from .engines import create_ocr_engine
 from .tesseract_engine import TesseractEngine
 from .normalize import normalize_paddle_output, normalize_tesseract_output, build_ocr_version
-from .quality import is_page_quality_ok, calculate_page_stats
+from .quality import is_page_quality_ok
 from ..config import (
     OCR_DPI_INITIAL,
     OCR_DPI_RERUN,
     OCR_MIN_CONFIDENCE,
     OCR_MIN_CHARS_PER_PAGE,
+    OCR_BATCH_SIZE,
     TESSERACT_LANG,
     PIPELINE_VERSION
 )
 
 
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Group an iterable into lists of at most size items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class PageResult:
     """Holds OCR results for a single page"""
+    __slots__ = ('page_num', 'blocks', 'method', 'dpi_used', 'needed_rerun', 'used_fallback')
+    
     def __init__(
         self,
         page_num: int,
@@ -42,6 +60,35 @@ class PageResult:
         self.used_fallback = used_fallback
 
 
+def _finalize_page(result: PageResult) -> OcrPage:
+    """
+    Normalize one page's engine blocks into an OcrPage.
+    
+    Args:
+        result: OCR result for the page
+        
+    Returns:
+        OcrPage with classified blocks, page text and average confidence
+    """
+    if result.method == 'paddle':
+        page_blocks = normalize_paddle_output(result.blocks)
+    else:
+        page_blocks = normalize_tesseract_output(result.blocks)
+    
+    # Calculate page text and confidence
+    page_text = '\n'.join([b.text for b in page_blocks])
+    confidences = [b.confidence for b in page_blocks if b.confidence is not None]
+    page_conf = sum(confidences) / len(confidences) if confidences else None
+    
+    return OcrPage(
+        page=result.page_num + 1,  # 1-indexed
+        blocks=page_blocks,
+        text=page_text,
+        raw_text=page_text,
+        confidence=page_conf
+    )
+
+
 def process_document_ocr(
     pdf_bytes: bytes,
     language: str = 'en',
@@ -75,13 +122,27 @@ def process_document_ocr(
     dpi_rerun = dpi_rerun or OCR_DPI_RERUN
     
     # Initialize engines (reuse for all pages)
-    paddle = PaddleEngine(lang=language, use_angle_cls=True)
+    paddle = create_ocr_engine(lang=language, use_angle_cls=True)
     tesseract = TesseractEngine(lang='eng' if language == 'en' else language)
     
     print(f"   Initializing OCR engines (Paddle + Tesseract)...")
     
+    # Parse the PDF once; every phase renders from this document
+    with PdfRenderer(pdf_bytes) as renderer:
+        return _process_document_ocr(renderer, paddle, tesseract, start_time, dpi_initial, dpi_rerun)
+
+
+def _process_document_ocr(
+    renderer: PdfRenderer,
+    paddle: PaddleEngine,
+    tesseract: TesseractEngine,
+    start_time: datetime,
+    dpi_initial: int,
+    dpi_rerun: int
+) -> OcrVersion:
+    """Run the OCR phases over an opened PDF (see process_document_ocr)"""
     # Get page count
-    page_count = get_page_count(pdf_bytes)
+    page_count = renderer.page_count
     print(f"   Processing {page_count} pages with OCR...")
     
     # Track results and metadata
@@ -91,26 +152,29 @@ def process_document_ocr(
     
     # Phase 1: Initial pass at DPI_INITIAL with PaddleOCR
     print(f"   Phase 1: PaddleOCR at {dpi_initial} DPI...")
-    for page_num in range(page_count):
-        img = render_page(pdf_bytes, page_num, dpi=dpi_initial)
-        blocks = paddle.ocr_image(img)
-        
-        stats = calculate_page_stats(blocks)
-        is_ok = is_page_quality_ok(blocks, OCR_MIN_CONFIDENCE, OCR_MIN_CHARS_PER_PAGE)
-        
-        if is_ok:
-            page_results.append(PageResult(
-                page_num=page_num,
-                blocks=blocks,
-                method='paddle',
-                dpi_used=dpi_initial,
-                needed_rerun=False,
-                used_fallback=False
-            ))
-        else:
-            # Mark as bad, will reprocess
-            bad_page_nums.append(page_num)
-            page_results.append(None)  # Placeholder
+    # Pages are rendered on a background thread while Paddle OCRs the previous batch
+    # closing() joins the render thread even if OCR raises mid-stream, so it
+    # is done with the document before the renderer closes it
+    with closing(renderer.prefetch(range(page_count), dpi_initial, 2 * OCR_BATCH_SIZE)) as rendered:
+        for batch in _batched(rendered, OCR_BATCH_SIZE):
+            page_nums, imgs = zip(*batch)
+            
+            for page_num, blocks in zip(page_nums, paddle.ocr_images(imgs)):
+                is_ok = is_page_quality_ok(blocks, OCR_MIN_CONFIDENCE, OCR_MIN_CHARS_PER_PAGE)
+                
+                if is_ok:
+                    page_results.append(PageResult(
+                        page_num=page_num,
+                        blocks=blocks,
+                        method='paddle',
+                        dpi_used=dpi_initial,
+                        needed_rerun=False,
+                        used_fallback=False
+                    ))
+                else:
+                    # Mark as bad, will reprocess
+                    bad_page_nums.append(page_num)
+                    page_results.append(None)  # Placeholder
     
     print(f"   ✓ Phase 1 complete: {len(bad_page_nums)} bad pages found")
     
@@ -118,69 +182,58 @@ def process_document_ocr(
     if bad_page_nums:
         print(f"   Phase 2: Rerendering {len(bad_page_nums)} pages at {dpi_rerun} DPI...")
         still_bad = []
+        # High-DPI renders of pages that fail again, reused by the Tesseract fallback
+        rerun_imgs: Dict[int, np.ndarray] = {}
         
-        for page_num in bad_page_nums:
-            img = render_page(pdf_bytes, page_num, dpi=dpi_rerun)
-            blocks = paddle.ocr_image(img)
-            
-            is_ok = is_page_quality_ok(blocks, OCR_MIN_CONFIDENCE, OCR_MIN_CHARS_PER_PAGE)
-            
-            if is_ok:
-                # Rerun succeeded
-                page_results[page_num] = PageResult(
-                    page_num=page_num,
-                    blocks=blocks,
-                    method='paddle',
-                    dpi_used=dpi_rerun,
-                    needed_rerun=True,
-                    used_fallback=False
-                )
-            else:
-                # Still bad, needs Tesseract
-                still_bad.append(page_num)
+        with closing(renderer.prefetch(bad_page_nums, dpi_rerun, 2 * OCR_BATCH_SIZE)) as rendered:
+            for batch in _batched(rendered, OCR_BATCH_SIZE):
+                page_nums, imgs = zip(*batch)
+                
+                for i, (page_num, blocks) in enumerate(zip(page_nums, paddle.ocr_images(imgs))):
+                    is_ok = is_page_quality_ok(blocks, OCR_MIN_CONFIDENCE, OCR_MIN_CHARS_PER_PAGE)
+                    
+                    if is_ok:
+                        # Rerun succeeded
+                        page_results[page_num] = PageResult(
+                            page_num=page_num,
+                            blocks=blocks,
+                            method='paddle',
+                            dpi_used=dpi_rerun,
+                            needed_rerun=True,
+                            used_fallback=False
+                        )
+                    else:
+                        # Still bad, needs Tesseract
+                        still_bad.append(page_num)
+                        rerun_imgs[page_num] = imgs[i]
         
         print(f"   ✓ Phase 2 complete: {len(still_bad)} pages still need fallback")
         
         # Phase 3: Tesseract fallback for still-bad pages
         if still_bad:
             print(f"   Phase 3: Tesseract fallback for {len(still_bad)} pages...")
-            for page_num in still_bad:
-                # Use the higher DPI image already rendered
-                img = render_page(pdf_bytes, page_num, dpi=dpi_rerun)
-                blocks = tesseract.ocr_image(img)
+            for page_nums in _batched(still_bad, OCR_BATCH_SIZE):
+                # Use the higher DPI images already rendered in Phase 2
+                imgs = [rerun_imgs[page_num] for page_num in page_nums]
                 
-                fallback_page_nums.append(page_num)
-                page_results[page_num] = PageResult(
-                    page_num=page_num,
-                    blocks=blocks,
-                    method='tesseract',
-                    dpi_used=dpi_rerun,
-                    needed_rerun=True,
-                    used_fallback=True
-                )
+                for page_num, blocks in zip(page_nums, tesseract.ocr_images(imgs)):
+                    fallback_page_nums.append(page_num)
+                    page_results[page_num] = PageResult(
+                        page_num=page_num,
+                        blocks=blocks,
+                        method='tesseract',
+                        dpi_used=dpi_rerun,
+                        needed_rerun=True,
+                        used_fallback=True
+                    )
             
             print(f"   ✓ Phase 3 complete: Tesseract processed {len(still_bad)} pages")
+        
+        # Release the high-DPI images before building the output
+        del rerun_imgs
     
     # Normalize results to OcrPage objects
-    ocr_pages: List[OcrPage] = []
-    for result in page_results:
-        if result.method == 'paddle':
-            page_blocks = normalize_paddle_output(result.blocks)
-        else:
-            page_blocks = normalize_tesseract_output(result.blocks)
-        
-        # Calculate page text and confidence
-        page_text = '\n'.join(b.text for b in page_blocks)
-        confidences = [b.confidence for b in page_blocks if b.confidence is not None]
-        page_conf = sum(confidences) / len(confidences) if confidences else None
-        
-        ocr_pages.append(OcrPage(
-            page=result.page_num + 1,  # 1-indexed
-            blocks=page_blocks,
-            text=page_text,
-            raw_text=page_text,
-            confidence=page_conf
-        ))
+    ocr_pages: List[OcrPage] = [_finalize_page(result) for result in page_results]
     
     # Determine engine and method
     if not fallback_page_nums:
@@ -3,23 +3,87 @@ Tesseract OCR engine wrapper for fallback OCR processing.
 Used when PaddleOCR produces poor results.
 """
 
+import logging
+import os
+import queue
+import tempfile
+import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List
 import pytesseract
 from PIL import Image
+from .blocks import OcrBlock
+from ..config import TESSDATA_PREFIX
 
+# tesserocr keeps one initialized Tesseract in-process; pytesseract (which
+# spawns a tesseract process and reloads the model per image) is the fallback
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
+# OCR runs on a thread pool: a logger's handler lock is cheaper than flushing
+# stdout per failed page, and operators can quiet the fallback path by level
+logger = logging.getLogger(__name__)
+
+# Blank-page gate: pages are area-averaged down to this square thumbnail, and
+# one whose darkest and lightest cells differ by less than the contrast limit
+# has no ink for Tesseract to read. Averaging keeps even a lone page number
+# well above the limit while flattening scanner noise.
+BLANK_CHECK_SIZE = 128
+BLANK_PAGE_MAX_CONTRAST = 32
+
+# ITU-R BT.601 luma weights; Tesseract recognizes on grayscale anyway
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def _to_grayscale(img: np.ndarray) -> np.ndarray:
+    """
+    Reduce an RGB page to a single uint8 plane before handing it to Tesseract.
+    
+    Args:
+        img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
+        
+    Returns:
+        H x W uint8 array (grayscale input is returned unchanged)
+    """
+    if img.ndim == 3:
+        return (img[..., :3] @ _LUMA_WEIGHTS).astype(np.uint8)
+    return img
+
+
+def _to_pil_image(img: np.ndarray) -> Image.Image:
+    """
+    Wrap a page as a grayscale PIL image without copying its pixels.
+    
+    Args:
+        img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
+        
+    Returns:
+        Mode 'L' image sharing the (contiguous) array's buffer
+    """
+    img = np.ascontiguousarray(_to_grayscale(img), dtype=np.uint8)
+    height, width = img.shape
+    return Image.frombuffer('L', (width, height), img, 'raw', 'L', 0, 1)
 
-class OcrBlock:
-    """Represents a text block detected by OCR"""
-    def __init__(
-        self,
-        text: str,
-        confidence: Optional[float] = None,
-        bbox: Optional[List[float]] = None
-    ):
-        self.text = text
-        self.confidence = confidence
-        self.bbox = bbox  # [x, y, width, height]
+
+@lru_cache(maxsize=1)
+def _get_tesseract_version() -> str:
+    """
+    Look up the installed Tesseract version once per process.
+    
+    pytesseract runs `tesseract --version` in a subprocess on every call, and
+    a new TesseractEngine is created for each document.
+    
+    Returns:
+        Version string (default "5.0.0" if tesseract can't be queried)
+    """
+    try:
+        return str(pytesseract.get_tesseract_version())
+    except Exception:
+        return "5.0.0"  # Default version
 
 
 class TesseractEngine:
@@ -29,7 +93,15 @@ class TesseractEngine:
     Used for pages where PaddleOCR produces poor results.
     """
     
-    def __init__(self, lang: str = 'eng', oem: int = 1, psm: int = 6):
+    def __init__(
+        self,
+        lang: str = 'eng',
+        oem: int = 1,
+        psm: int = 6,
+        max_workers: Optional[int] = None,
+        binarize: bool = True,
+        denoise: bool = False
+    ):
         """
         Initialize Tesseract engine.
         
@@ -37,67 +109,205 @@ class TesseractEngine:
             lang: Language code (default 'eng')
             oem: OCR Engine Mode (default 1 = LSTM only)
             psm: Page Segmentation Mode (default 6 = single uniform block)
+            max_workers: Pages recognized concurrently by ocr_images
+                (default one per CPU core)
+            binarize: Otsu-threshold pages before recognition (see preprocess)
+            denoise: Apply a 3x3 median filter to remove speckle noise
         """
         self.lang = lang
         self.oem = oem
         self.psm = psm
         self.config = f'--oem {oem} --psm {psm}'
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.binarize = binarize
+        self.denoise = denoise
+        
+        # tesserocr APIs are not thread-safe: each call checks one out of the
+        # idle pool (creating another if all are busy) and returns it after.
+        # None are created up front, so documents whose pages never fall back
+        # to Tesseract don't pay for loading its model.
+        self._apis = []
+        self._idle_apis = queue.SimpleQueue()
+        self.use_tesserocr = PyTessBaseAPI is not None
+    
+    def _create_api(self):
+        """
+        Initialize a persistent tesserocr API (model loaded once).
+        
+        Returns:
+            PyTessBaseAPI, or None to use the pytesseract fallback
+        """
+        if PyTessBaseAPI is None:
+            return None
+        
+        # Engine and segmentation modes are fixed per API, not set per page
+        kwargs = {'lang': self.lang, 'oem': OEM(self.oem), 'psm': PSM(self.psm)}
+        if TESSDATA_PREFIX:
+            kwargs['path'] = TESSDATA_PREFIX
+        
+        try:
+            api = PyTessBaseAPI(**kwargs)
+        except RuntimeError as e:
+            logger.warning("tesserocr init failed, using pytesseract: %s", e)
+            return None
+        
+        self._apis.append(api)
+        return api
+    
+    def __del__(self):
+        for api in getattr(self, '_apis', ()):
+            api.End()
+    
+    def _should_ocr(self, img: np.ndarray) -> bool:
+        """
+        Check whether a page has any ink worth sending to Tesseract.
+        
+        Args:
+            img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
+            
+        Returns:
+            False for blank or near-blank pages, True otherwise
+        """
+        thumb = cv2.resize(
+            _to_grayscale(img),
+            (BLANK_CHECK_SIZE, BLANK_CHECK_SIZE),
+            interpolation=cv2.INTER_AREA
+        )
+        return int(thumb.max()) - int(thumb.min()) >= BLANK_PAGE_MAX_CONTRAST
+    
+    def preprocess(self, img: np.ndarray) -> np.ndarray:
+        """
+        Prepare a page for Tesseract in one OpenCV pipeline.
+        
+        Grayscale, then Otsu binarization (clean black-on-white input cuts
+        Tesseract's own thresholding and LSTM work), then an optional median
+        filter for scans with speckle noise.
+        
+        Args:
+            img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
+            
+        Returns:
+            H x W uint8 array ready for SetImageBytes
+        """
+        img = _to_grayscale(img)
+        if self.binarize:
+            _, img = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        if self.denoise:
+            img = cv2.medianBlur(img, 3)
+        return img
     
     def ocr_image(self, img: np.ndarray) -> List[OcrBlock]:
         """
         Run OCR on an image.
         
         Args:
-            img: Image as numpy array (H x W x 3, RGB)
+            img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
             
         Returns:
             List of OcrBlock objects with text (confidence may be None)
         """
+        img = _to_grayscale(img)
+        
+        # Gate on the unthresholded page: Otsu would turn a blank page's
+        # noise into full-contrast specks
+        if not self._should_ocr(img):
+            return []
+        img = self.preprocess(img)
+        
+        if not self.use_tesserocr:
+            return self._ocr_image_pytesseract(img)
+        
+        try:
+            api = self._idle_apis.get_nowait()
+        except queue.Empty:
+            api = self._create_api()
+            if api is None:
+                if not self._apis:
+                    # tesserocr can't load the model at all: stay on pytesseract
+                    self.use_tesserocr = False
+                return self._ocr_image_pytesseract(img)
+        
         try:
-            # Convert numpy array to PIL Image
-            pil_img = Image.fromarray(img)
+            return self._ocr_image_tesserocr(api, img)
+        finally:
+            self._idle_apis.put(api)
+    
+    def _ocr_image_tesserocr(self, api, img: np.ndarray) -> List[OcrBlock]:
+        """
+        Run OCR on an image with an in-process tesserocr API.
+        
+        Args:
+            api: PyTessBaseAPI not in use by any other thread
+            img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
             
-            # Get detailed data with bounding boxes and confidence
-            data = pytesseract.image_to_data(
-                pil_img,
-                lang=self.lang,
-                config=self.config,
-                output_type=pytesseract.Output.DICT
+        Returns:
+            List of OcrBlock objects with text and confidence
+        """
+        try:
+            # Hand Tesseract the raw pixel buffer instead of a PIL image
+            # (SetImage re-encodes the PIL image before Tesseract reads it)
+            img = np.ascontiguousarray(img, dtype=np.uint8)
+            height, width = img.shape[:2]
+            bytes_per_pixel = 1 if img.ndim == 2 else img.shape[2]
+            api.SetImageBytes(
+                img.tobytes(), width, height,
+                bytes_per_pixel, width * bytes_per_pixel
             )
+            api.Recognize()
             
             blocks = []
-            n_boxes = len(data['text'])
-            
-            for i in range(n_boxes):
-                text = data['text'][i].strip()
-                conf = data['conf'][i]
+            level = RIL.WORD
+            for word in iterate_level(api.GetIterator(), level):
+                text = word.GetUTF8Text(level)
+                text = text.strip() if text else ''
+                conf = word.Confidence(level)
                 
                 # Skip empty text or very low confidence
                 if not text or conf < 0:
                     continue
                 
-                # Extract bbox
-                x = data['left'][i]
-                y = data['top'][i]
-                width = data['width'][i]
-                height = data['height'][i]
-                
-                # Normalize confidence to 0-1 range (Tesseract uses 0-100)
-                confidence = float(conf) / 100.0 if conf >= 0 else None
+                # BoundingBox is (x1, y1, x2, y2)
+                x1, y1, x2, y2 = word.BoundingBox(level)
                 
                 blocks.append(OcrBlock(
                     text=text,
-                    confidence=confidence,
-                    bbox=[x, y, width, height]
+                    confidence=conf / 100.0,  # Tesseract uses 0-100
+                    bbox=(x1, y1, x2 - x1, y2 - y1)
                 ))
             
             return blocks
             
-        except Exception as e:
-            print(f"Tesseract error: {e}")
+        except Exception:
+            logger.exception("tesserocr error, retrying with pytesseract")
+            return self._ocr_image_pytesseract(img)
+    
+    def _ocr_image_pytesseract(self, img: np.ndarray) -> List[OcrBlock]:
+        """
+        Run OCR on an image through the tesseract CLI (pytesseract).
+        
+        Args:
+            img: Image as numpy array (H x W grayscale or H x W x 3 RGB)
+            
+        Returns:
+            List of OcrBlock objects with text (confidence may be None)
+        """
+        pil_img = _to_pil_image(img)
+        
+        try:
+            # Get detailed data with bounding boxes and confidence
+            data = pytesseract.image_to_data(
+                pil_img,
+                lang=self.lang,
+                config=self.config,
+                output_type=pytesseract.Output.DICT
+            )
+            
+            return self._blocks_from_data(data, 1)[0]
+            
+        except Exception:
+            logger.exception("Tesseract error")
             # Fallback to simple text extraction without bbox
             try:
-                pil_img = Image.fromarray(img)
                 text = pytesseract.image_to_string(
                     pil_img,
                     lang=self.lang,
@@ -108,17 +318,147 @@ class TesseractEngine:
                     return [OcrBlock(text=text, confidence=None, bbox=None)]
                 return []
                 
-            except Exception as e2:
-                print(f"Tesseract fallback error: {e2}")
+            except Exception:
+                logger.exception("Tesseract fallback error")
                 return []
     
-    def get_version(self) -> str:
-        """Get Tesseract version"""
+    def _blocks_from_data(self, data: dict, page_count: int) -> List[List[OcrBlock]]:
+        """
+        Convert pytesseract image_to_data output into OcrBlocks per page.
+        
+        Args:
+            data: image_to_data result (Output.DICT)
+            page_count: Number of images that were recognized
+            
+        Returns:
+            One list of OcrBlock objects per image, by TSV page_num
+        """
+        pages = [[] for _ in range(page_count)]
+        # Bound appends and local column references keep the per-row work to
+        # list indexing (no dict lookups or method binding inside the loop)
+        appends = [page.append for page in pages]
+        texts, confs = data['text'], data['conf']
+        lefts, tops = data['left'], data['top']
+        widths, heights = data['width'], data['height']
+        page_nums = data['page_num']
+        
+        # Page/block/paragraph/line rows carry conf -1: mask them out in one
+        # vectorized comparison so only word rows reach the Python loop
+        word_rows = np.flatnonzero(np.asarray(confs, dtype=np.float64) >= 0)
+        
+        for i in word_rows.tolist():
+            text = texts[i].strip()
+            
+            # Skip empty text
+            if not text:
+                continue
+            
+            appends[page_nums[i] - 1](OcrBlock(
+                text,
+                confs[i] * 0.01,  # Tesseract uses 0-100
+                (lefts[i], tops[i], widths[i], heights[i])
+            ))
+        
+        return pages
+    
+    def _ocr_images_pytesseract(self, imgs: List[np.ndarray]) -> List[List[OcrBlock]]:
+        """
+        Run OCR on several images with a single tesseract process.
+        
+        The images are written to a temporary directory and listed in
+        images.txt, which tesseract reads as a multi-page input, so the
+        language model is loaded once for the whole batch.
+        
+        Args:
+            imgs: Images as numpy arrays (H x W grayscale or H x W x 3 RGB)
+            
+        Returns:
+            One list of OcrBlock objects per input image, in order
+        """
         try:
-            version = pytesseract.get_tesseract_version()
-            return str(version)
-        except:
-            return "5.0.0"  # Default version
+            with tempfile.TemporaryDirectory(prefix='flashread_tess_') as tmp_dir:
+                paths = []
+                for i, img in enumerate(imgs):
+                    path = os.path.join(tmp_dir, f'page_{i:05d}.png')
+                    # Light compression: the file is read back exactly once
+                    _to_pil_image(self.preprocess(img)).save(path, 'PNG', compress_level=1)
+                    paths.append(path)
+                
+                list_path = os.path.join(tmp_dir, 'images.txt')
+                with open(list_path, 'w') as f:
+                    f.write('\n'.join(paths) + '\n')
+                
+                data = pytesseract.image_to_data(
+                    list_path,
+                    lang=self.lang,
+                    config=self.config,
+                    output_type=pytesseract.Output.DICT
+                )
+            
+            return self._blocks_from_data(data, len(imgs))
+            
+        except Exception:
+            logger.exception("Tesseract batch error")
+            return [self.ocr_image(img) for img in imgs]
+    
+    def ocr_images(self, imgs: List[np.ndarray]) -> List[List[OcrBlock]]:
+        """
+        Run OCR on several images.
+        
+        With tesserocr the pages are spread over a pool of persistent APIs
+        (see ocr_images_parallel). With the pytesseract fallback the whole batch goes through one tesseract
+        process instead of one process (and model load) per image.
+        
+        Args:
+            imgs: Images as numpy arrays (H x W grayscale or H x W x 3 RGB)
+            
+        Returns:
+            One list of OcrBlock objects per input image, in order
+        """
+        if self.use_tesserocr:
+            return self.ocr_images_parallel(imgs)
+        
+        # Leave blank pages out of the tesseract batch entirely
+        results = [[] for _ in imgs]
+        inked = [i for i, img in enumerate(imgs) if self._should_ocr(img)]
+        
+        if len(inked) == 1:
+            results[inked[0]] = self._ocr_image_pytesseract(self.preprocess(imgs[inked[0]]))
+        elif inked:
+            batch = self._ocr_images_pytesseract([imgs[i] for i in inked])
+            for i, blocks in zip(inked, batch):
+                results[i] = blocks
+        
+        return results
+    
+    def ocr_images_parallel(
+        self,
+        imgs: List[np.ndarray],
+        max_workers: Optional[int] = None
+    ) -> List[List[OcrBlock]]:
+        """
+        Run OCR on several images concurrently, one tesserocr API per thread.
+        
+        Tesseract releases the GIL while recognizing, so pages on separate
+        APIs run in parallel on separate cores.
+        
+        Args:
+            imgs: Images as numpy arrays (H x W grayscale or H x W x 3 RGB)
+            max_workers: Concurrent pages (default the engine's max_workers)
+            
+        Returns:
+            One list of OcrBlock objects per input image, in order
+        """
+        workers = min(max_workers or self.max_workers, len(imgs))
+        if workers <= 1:
+            return [self.ocr_image(img) for img in imgs]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tesseract') as pool:
+            return list(pool.map(self.ocr_image, imgs))
+    
+    def get_version(self) -> str:
+        """Get Tesseract version (looked up once per process)"""
+        return _get_tesseract_version()
     
     def calculate_page_confidence(self, blocks: List[OcrBlock]) -> Optional[float]:
         """
@@ -130,14 +470,15 @@ class TesseractEngine:
         Returns:
             Average confidence (0-1) or None if no confidence data
         """
-        if not blocks:
-            return None
-        
-        confidences = [b.confidence for b in blocks if b.confidence is not None]
-        if not confidences:
-            return None
+        total = 0.0
+        n = 0
+        for b in blocks:
+            confidence = b.confidence
+            if confidence is not None:
+                total += confidence
+                n += 1
         
-        return sum(confidences) / len(confidences)
+        return total / n if n else None
     
     def calculate_page_char_count(self, blocks: List[OcrBlock]) -> int:
         """
@@ -149,4 +490,4 @@ class TesseractEngine:
         Returns:
             Total character count
         """
-        return sum(len(b.text) for b in blocks)
+        return sum(map(len, [b.text for b in blocks]))
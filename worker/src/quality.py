@@ -1,3 +1,15 @@
+from datetime import datetime, timezone
+
+# Characters that don't count toward the non-whitespace ratio
+_WHITESPACE_CHARS = (' ', '\n', '\t', '\r')
+# Deletion table for the same characters: one str.translate pass on ASCII text
+_WHITESPACE_DELETE = str.maketrans('', '', ''.join(_WHITESPACE_CHARS))
+
+# The whitespace ratio is measured on at most this many leading characters;
+# text layers are uniform enough that a prefix is representative
+WHITESPACE_SAMPLE_CHARS = 65536
+
+
 def is_extraction_sufficient(text: str, page_count: int) -> bool:
     """
     Determine if direct text extraction yielded usable content.
@@ -5,7 +17,8 @@ def is_extraction_sufficient(text: str, page_count: int) -> bool:
     
     Quality heuristics:
     - Minimum character count: max(500, 50 * page_count)
-    - Non-whitespace ratio: > 0.5 (to filter out garbage)
+    - Non-whitespace ratio: > 0.5 (to filter out garbage), measured on the
+      first WHITESPACE_SAMPLE_CHARS characters
     
     Args:
         text: Extracted text from PDF
@@ -25,11 +38,15 @@ def is_extraction_sufficient(text: str, page_count: int) -> bool:
         return False
     
     # Check non-whitespace ratio (filter out PDFs with only spaces/newlines)
-    text_without_ws = text.replace(' ', '').replace('\n', '').replace('\t', '').replace('\r', '')
-    if len(text) == 0:
-        return False
-    
-    non_ws_ratio = len(text_without_ws) / len(text)
+    sample = text if char_count <= WHITESPACE_SAMPLE_CHARS else text[:WHITESPACE_SAMPLE_CHARS]
+    if sample.isascii():
+        # One C pass over the ASCII fast path of str.translate
+        non_ws_count = len(sample.translate(_WHITESPACE_DELETE))
+    else:
+        # translate falls back to a per-character lookup on non-ASCII text;
+        # str.count stays a plain C scan per character
+        non_ws_count = len(sample) - sum(map(sample.count, _WHITESPACE_CHARS))
+    non_ws_ratio = non_ws_count / len(sample)
     
     return non_ws_ratio > 0.5
 
@@ -49,6 +66,6 @@ def generate_version_key(engine: str, engine_ver: str, pipeline_ver: str) -> str
     Returns:
         Version key string
     """
-    from datetime import datetime
-    ts = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    now = datetime.now(timezone.utc)
+    ts = f"{now.year:04d}{now.month:02d}{now.day:02d}{now.hour:02d}{now.minute:02d}{now.second:02d}"
     return f"{engine}_{engine_ver}_{pipeline_ver}_{ts}"
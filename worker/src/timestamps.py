@@ -0,0 +1,21 @@
+"""
+UTC timestamps in the ISO 8601 form written to the database and OCR results.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+
+def utc_iso(offset_seconds: float = 0) -> str:
+    """
+    Current UTC time as ISO 8601 with millisecond precision and a Z suffix.
+    
+    Args:
+        offset_seconds: Seconds to add to the current time (e.g. a retry delay)
+        
+    Returns:
+        Timestamp string, e.g. 2026-01-31T12:00:00.000Z
+    """
+    ts = datetime.now(timezone.utc)
+    if offset_seconds:
+        ts += timedelta(seconds=offset_seconds)
+    return ts.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
@@ -0,0 +1,35 @@
+"""
+Tests for content-based block classification and its memoization.
+"""
+
+from src.ocr import classifier
+from src.ocr.classifier import BlockType, classify_content
+
+
+def test_short_and_long_text_classify_alike():
+    """Text past the cache limit goes through the same patterns uncached"""
+    long_caption = 'Figure 3: ' + 'measured throughput per worker ' * 4
+    long_paragraph = 'The worker claims jobs from the queue and ' * 4
+    assert len(long_caption) > classifier.CLASSIFY_CACHE_MAX_CHARS
+
+    assert classify_content('Figure 3: Throughput') == BlockType.CAPTION
+    assert classify_content(long_caption) == BlockType.CAPTION
+    assert classify_content('12') == BlockType.PAGE_NUMBER
+    assert classify_content(long_paragraph.strip()) is None
+
+
+def test_only_short_text_is_cached():
+    """Paragraph-length text is never stored in the classification caches"""
+    classifier._classify_content_cached.cache_clear()
+    classifier._matches_cached.cache_clear()
+    long_text = 'Chapter ' + 'x' * 200
+
+    classify_content(long_text)
+    classifier.is_caption(long_text)
+    assert classifier._classify_content_cached.cache_info().currsize == 0
+    assert classifier._matches_cached.cache_info().currsize == 0
+
+    classify_content('Chapter 1')
+    classifier.is_caption('Figure 1')
+    assert classifier._classify_content_cached.cache_info().currsize == 1
+    assert classifier._matches_cached.cache_info().currsize == 1
@@ -0,0 +1,64 @@
+"""
+Tests for direct PDF text extraction (serial and process-pool paths).
+"""
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+
+from src import extractor
+
+
+def _make_pdf(page_count: int) -> bytes:
+    """Build a PDF whose pages each carry their own page number as text"""
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page body number {i + 1}")
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    """Record the start method of every extraction pool, with CPU count pinned at 4"""
+    started = []
+    real_pool = extractor.ProcessPoolExecutor
+
+    def recording_pool(*args, **kwargs):
+        started.append(kwargs['mp_context'].get_start_method())
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(extractor, 'ProcessPoolExecutor', recording_pool)
+    monkeypatch.setattr(extractor.os, 'cpu_count', lambda: 4)
+    return started
+
+
+@pytest.mark.parametrize('multiple, expected_pools', [(1, []), (2, ['forkserver'])])
+def test_raw_pages_match_serial_extraction(pools, multiple, expected_pools):
+    """From PARALLEL_MIN_PAGES up, pooled extraction returns the serial result in page order"""
+    page_count = extractor.PARALLEL_MIN_PAGES * multiple
+    pdf_bytes = _make_pdf(page_count)
+
+    raw_pages = extractor._extract_raw_pages(pdf_bytes, page_count)
+
+    # One range per PARALLEL_MIN_PAGES pages, so only the larger document uses a pool
+    assert pools == expected_pools
+    assert raw_pages == extractor._extract_page_range(pdf_bytes, 0, page_count)
+    assert [blocks[0][4].strip() for blocks, _, _ in raw_pages] == [
+        f"Page body number {i + 1}" for i in range(page_count)
+    ]
+
+
+def test_extract_text_from_pdf_parallel(pools):
+    """The pooled path feeds page-ordered text into the extraction result"""
+    page_count = extractor.PARALLEL_MIN_PAGES * 2
+
+    result = extractor.extract_text_from_pdf(_make_pdf(page_count))
+
+    assert pools == ['forkserver']
+    assert result.metrics.total_pages == page_count
+    assert [page.page for page in result.pages] == list(range(1, page_count + 1))
+    assert result.pages[-1].text == f"Page body number {page_count}"
@@ -0,0 +1,101 @@
+"""
+Tests for the worker main loop (job prefetching and error recovery).
+"""
+
+import importlib
+import sys
+import threading
+import types
+from types import SimpleNamespace
+
+import pytest
+
+
+def _load_main(monkeypatch, claim_job, download_pdf, release_job=None):
+    """Import src.main against a stand-in src.db (the real one connects at import)"""
+    db = types.ModuleType('src.db')
+    db.claim_job = claim_job
+    db.download_pdf = download_pdf
+    db.complete_job = lambda *args, **kwargs: None
+    db.fail_job = lambda *args, **kwargs: None
+    db.release_job = release_job or (lambda *args, **kwargs: None)
+    db.wait_for_job = lambda *args, **kwargs: None
+    db.backoff_delay = lambda *args, **kwargs: 0
+    monkeypatch.setitem(sys.modules, 'src.db', db)
+    monkeypatch.delitem(sys.modules, 'src.main', raising=False)
+
+    main = importlib.import_module('src.main')
+    monkeypatch.setattr(main, 'validate_config', lambda: None)
+
+    # The error handler sleeps between retries: stop a worker that keeps failing
+    sleeps = []
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) > 3:
+            raise KeyboardInterrupt
+    monkeypatch.setattr(main.time, 'sleep', sleep)
+    return main
+
+
+def test_claim_error_does_not_wedge_prefetch(monkeypatch):
+    """A claim that raises on the prefetch thread is retried on the next iteration"""
+    job = SimpleNamespace(id='job-1', document_id='doc-1', job_type='extraction')
+    claims = []
+
+    def claim_job(worker_id, job_types=None):
+        claims.append(worker_id)
+        if len(claims) == 1:
+            raise RuntimeError('transient PostgREST 503')
+        if len(claims) == 2:
+            return job
+        # Stop the worker once the recovered job has been handed off
+        raise KeyboardInterrupt
+
+    main = _load_main(monkeypatch, claim_job, lambda document_id: b'%PDF')
+    handled = []
+    monkeypatch.setattr(
+        main, 'handle_extraction_job',
+        lambda claimed, pdf_bytes: handled.append((claimed.id, pdf_bytes))
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main.main()
+
+    assert exc_info.value.code == 0
+    assert len(claims) == 3
+    assert handled == [('job-1', b'%PDF')]
+
+
+def test_prefetched_job_released_when_loop_exits_on_error(monkeypatch):
+    """An error escaping the loop still hands the prefetched job back"""
+    jobs = [
+        SimpleNamespace(id='job-1', document_id='doc-1', job_type='extraction'),
+        SimpleNamespace(id='job-2', document_id='doc-2', job_type='extraction'),
+    ]
+    prefetched = threading.Event()
+
+    def claim_job(worker_id, job_types=None):
+        if not jobs:
+            return None
+        job = jobs.pop(0)
+        if job.id == 'job-2':
+            prefetched.set()
+        return job
+
+    released = []
+    main = _load_main(
+        monkeypatch, claim_job, lambda document_id: b'%PDF', released.append
+    )
+
+    def handle_extraction_job(job, pdf_bytes):
+        # Fail only once the next job has been claimed behind this one
+        assert prefetched.wait(timeout=5)
+        raise SystemExit(3)
+
+    monkeypatch.setattr(main, 'handle_extraction_job', handle_extraction_job)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main.main()
+
+    assert exc_info.value.code == 3
+    assert released == ['job-2']
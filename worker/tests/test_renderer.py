@@ -0,0 +1,49 @@
+"""
+Tests for background page rendering (prefetch_rendered_pages).
+"""
+
+import threading
+from contextlib import closing
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+
+from src.ocr.renderer import PdfRenderer
+
+
+def _make_pdf(page_count: int) -> bytes:
+    """Build a PDF with page_count blank pages"""
+    doc = fitz.open()
+    for _ in range(page_count):
+        doc.new_page()
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def _render_threads():
+    return [t for t in threading.enumerate() if t.name == 'render']
+
+
+def test_prefetch_yields_pages_in_order():
+    with PdfRenderer(_make_pdf(5)) as renderer:
+        pages = list(renderer.prefetch([3, 0, 4], dpi=36, buffer_size=1))
+
+    assert [page_num for page_num, _ in pages] == [3, 0, 4]
+    assert not _render_threads()
+
+
+def test_render_thread_joined_when_consumer_raises():
+    with pytest.raises(RuntimeError):
+        with PdfRenderer(_make_pdf(20)) as renderer:
+            with closing(renderer.prefetch(dpi=36, buffer_size=2)) as rendered:
+                for page_num, _ in rendered:
+                    if page_num == 1:
+                        raise RuntimeError('OCR failed')
+                    # Still rendering ahead of the consumer
+                    assert _render_threads()
+
+    # Joined before the document was closed, not left rendering after it
+    assert not _render_threads()
@@ -0,0 +1,80 @@
+"""
+Tests for TesseractEngine page batching and preprocessing.
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('cv2')
+pytest.importorskip('pytesseract')
+
+from src.ocr import tesseract_engine
+from src.ocr.blocks import OcrBlock
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """TesseractEngine on the pytesseract path, with the tesseract calls recorded"""
+    monkeypatch.setattr(tesseract_engine, 'PyTessBaseAPI', None)
+    engine = tesseract_engine.TesseractEngine()
+    engine.single_calls = []
+    engine.batch_calls = []
+
+    def ocr_single(img):
+        engine.single_calls.append(img)
+        return [OcrBlock('text', 0.9, (0, 0, 1, 1))]
+
+    def ocr_batch(imgs):
+        engine.batch_calls.append(imgs)
+        return [[OcrBlock('text', 0.9, (0, 0, 1, 1))] for _ in imgs]
+
+    monkeypatch.setattr(engine, '_ocr_image_pytesseract', ocr_single)
+    monkeypatch.setattr(engine, '_ocr_images_pytesseract', ocr_batch)
+    return engine
+
+
+def _blank_page() -> np.ndarray:
+    return np.full((400, 300), 255, dtype=np.uint8)
+
+
+def _inked_page() -> np.ndarray:
+    # Gray text strokes on an off-white background
+    page = np.full((400, 300), 220, dtype=np.uint8)
+    page[100:140:4, 50:250] = 60
+    return page
+
+
+def test_single_inked_page_in_batch_is_binarized(engine):
+    """A batch with one inked page gets the same Otsu preprocessing as a full batch"""
+    results = engine.ocr_images([_blank_page(), _inked_page(), _blank_page()])
+
+    assert results[0] == [] and results[2] == []
+    assert len(results[1]) == 1
+    assert engine.batch_calls == []
+    assert len(engine.single_calls) == 1
+    assert set(np.unique(engine.single_calls[0])) <= {0, 255}
+
+
+def test_tesserocr_api_created_on_first_page(monkeypatch):
+    """Constructing the engine doesn't load the Tesseract model; the first page does"""
+    created = []
+
+    class FakeApi:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+        def End(self):
+            pass
+
+    monkeypatch.setattr(tesseract_engine, 'PyTessBaseAPI', FakeApi)
+    monkeypatch.setattr(tesseract_engine, 'OEM', int, raising=False)
+    monkeypatch.setattr(tesseract_engine, 'PSM', int, raising=False)
+    engine = tesseract_engine.TesseractEngine()
+    monkeypatch.setattr(engine, '_ocr_image_tesserocr', lambda api, img: [])
+
+    assert engine.use_tesserocr
+    assert created == []
+
+    engine.ocr_image(_inked_page())
+    engine.ocr_image(_inked_page())
+    assert len(created) == 1
@@ -0,0 +1,25 @@
+"""
+Tests for the shared UTC timestamp helper.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+from src.timestamps import utc_iso
+
+
+def _parse(ts: str) -> datetime:
+    return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+
+
+def test_utc_iso_format():
+    """Millisecond precision, Z suffix, and actually UTC"""
+    ts = utc_iso()
+    assert re.fullmatch(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z', ts)
+    assert abs(_parse(ts) - datetime.now(timezone.utc)) < timedelta(seconds=5)
+
+
+def test_utc_iso_offset():
+    """Offsets shift the timestamp (used for retry backoff deadlines)"""
+    delta = _parse(utc_iso(90)) - _parse(utc_iso())
+    assert timedelta(seconds=89) < delta < timedelta(seconds=91)